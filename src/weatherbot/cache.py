@@ -1,9 +1,13 @@
 # src/weatherbot/cache.py
 """Simple file-based caching for API responses."""
 
+import functools
 import json
 import logging
+import threading
 import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
 from pathlib import Path
 from typing import Any
 
@@ -153,5 +157,107 @@ class APICache:
             logger.warning(f"Failed to cleanup expired cache: {e}")
 
 
+class TTLCache:
+    """Thread-safe in-process cache with per-entry expiry and LRU eviction.
+
+    Unlike APICache, values are kept as live Python objects (e.g. parsed
+    cones with Shapely geometries) and are never written to disk.
+    """
+
+    def __init__(self, ttl_seconds: float = 300, maxsize: int = 128) -> None:
+        """Initialize cache.
+
+        Args:
+            ttl_seconds: Time to live in seconds for each entry
+            maxsize: Maximum number of entries before evicting the oldest
+        """
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a cached value.
+
+        Args:
+            key: Cache key
+            default: Value returned when the key is missing or expired
+
+        Returns:
+            Cached value or default
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+
+            stored_at, value = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                return default
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Set a cached value.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Clear all cached values."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Number of stored entries, including any not yet evicted."""
+        return len(self._entries)
+
+
+_MISSING = object()
+
+
+def ttl_cache(seconds: float, maxsize: int = 128) -> Callable[[Callable], Callable]:
+    """Memoize a function's results for a limited time.
+
+    Results are keyed by the call arguments, so arguments must be hashable.
+    Exceptions are not cached.
+
+    Args:
+        seconds: Time to live in seconds for each result
+        maxsize: Maximum number of distinct argument sets to keep
+
+    Returns:
+        Decorator wrapping the function with a TTLCache
+    """
+    def decorator(func: Callable) -> Callable:
+        cache = TTLCache(ttl_seconds=seconds, maxsize=maxsize)
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = (args, tuple(sorted(kwargs.items())))
+            value = cache.get(key, _MISSING)
+            if value is _MISSING:
+                value = func(*args, **kwargs)
+                cache.set(key, value)
+            else:
+                logger.debug(f"TTL cache hit for {func.__name__}")
+            return value
+
+        wrapper.cache = cache
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
+
+
 # Global cache instance
 api_cache = APICache()
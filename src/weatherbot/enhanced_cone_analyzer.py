@@ -1,22 +1,264 @@
 # src/weatherbot/enhanced_cone_analyzer.py
 """Enhanced cone intersection analyzer with optimized accuracy and performance."""
 
+import functools
+import hashlib
 import logging
+import math
+import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
+from pathlib import Path
 
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+from shapely.geometry import Point, Polygon
 from shapely.geometry.base import BaseGeometry
+from shapely.prepared import PreparedGeometry, prep
+from shapely.strtree import STRtree
+from urllib3.util.retry import Retry
 
 from .alert_levels import AlertLevel
 from .atcf_client import get_atcf_invest_positions
-from .geometry import load_county_polygon, point_in_any, polygon_intersects_any
+from .cache import TTLCache, api_cache, ttl_cache
+from .geometry import load_county_polygon, point_in_any
 from .nhc import NHCCone, get_active_cones
-from .nhc_current_storms import get_current_storms_with_positions
+from .nhc_current_storms import (
+    get_active_atlantic_bins,
+    get_current_storms_with_positions,
+)
 from .nhc_storm_tracker import get_all_active_storm_cones
 from .nws import get_hurricane_alerts
 
 logger = logging.getLogger(__name__)
 
+# Storm speed in a movement string such as "NW at 12 mph"
+_SPEED_RE = re.compile(r"(\d+)\s*(mph|kph|km/h|knots)", re.IGNORECASE)
+
+# Mean Earth radius used for great-circle distances
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEGREE = EARTH_RADIUS_KM * math.pi / 180.0
+
+# Safety factor on the equirectangular distance prefilter. At the 2000 km
+# radius analyze_location_threat uses, the mean-latitude projection
+# overstates distance by at most 13% while both points lie between 78S and
+# 78N, so within that band the 15% margin never rejects a storm haversine
+# would keep. Nearer the poles it can (a target at 72N and a storm at 86N,
+# 80 degrees of longitude apart, are 1972 km apart but dropped).
+PREFILTER_MARGIN = 1.15
+
+# Process-local cache lifetimes for upstream fetches (seconds)
+STORM_DATA_TTL_SECONDS = 300
+ALERTS_TTL_SECONDS = 120
+ANALYSIS_TTL_SECONDS = 60
+ADVISORY_TTL_SECONDS = 300
+
+# Parsed tropical weather outlook alerts keyed by URL
+_outlook_alerts_cache = TTLCache(ttl_seconds=STORM_DATA_TTL_SECONDS, maxsize=8)
+
+# NHC text products checked for Bahamas watches/warnings
+_NHC_HEADERS = {"User-Agent": "weatherbot (alerts@example.com)"}
+_NHC_OUTLOOK_URL = "https://www.nhc.noaa.gov/text/refresh/MIATWOAT+shtml/latest.shtml"
+
+# Public advisory for an Atlantic advisory bin (AT1-AT5)
+_ADVISORY_URL_TEMPLATE = "https://www.nhc.noaa.gov/text/refresh/MIATCP{bin}+shtml/latest.shtml"
+
+# Every Atlantic bin, checked when the active bins are unknown
+_STORM_ADVISORY_URLS = tuple(
+    _ADVISORY_URL_TEMPLATE.format(bin=bin_number) for bin_number in ("AT4", "AT3", "AT1", "AT2", "AT5")
+)
+
+# Raw NHC storm advisory text keyed by URL
+_advisory_text_cache = TTLCache(ttl_seconds=ADVISORY_TTL_SECONDS, maxsize=16)
+
+# Parsed advisory alerts keyed by (URL, region area), stored with the text they came from
+_advisory_alerts_cache = TTLCache(ttl_seconds=ADVISORY_TTL_SECONDS, maxsize=32)
+
+# Completed analyses keyed by rounded location, county options and storm set
+_analysis_cache = TTLCache(ttl_seconds=ANALYSIS_TTL_SECONDS, maxsize=32)
+
+
+@ttl_cache(seconds=STORM_DATA_TTL_SECONDS)
+def _cached_atlantic_bins() -> list[str] | None:
+    """Get active Atlantic advisory bins, cached for a short TTL."""
+    return get_active_atlantic_bins()
+
+
+@ttl_cache(seconds=STORM_DATA_TTL_SECONDS)
+def _cached_storm_cones() -> list[NHCCone]:
+    """Get cones from individual storm pages, cached for a short TTL."""
+    return get_all_active_storm_cones()
+
+
+@ttl_cache(seconds=STORM_DATA_TTL_SECONDS)
+def _cached_current_storms() -> list[NHCCone]:
+    """Get storms from CurrentStorms.json, cached for a short TTL."""
+    return get_current_storms_with_positions()
+
+
+@ttl_cache(seconds=STORM_DATA_TTL_SECONDS)
+def _cached_atcf_positions() -> dict[str, tuple[float, float]]:
+    """Get ATCF invest positions, cached for a short TTL."""
+    return get_atcf_invest_positions()
+
+
+@ttl_cache(seconds=STORM_DATA_TTL_SECONDS)
+def _cached_active_cones() -> tuple[list[NHCCone], list[BaseGeometry]]:
+    """Get MapServer cones, cached for a short TTL."""
+    return get_active_cones()
+
+
+@ttl_cache(seconds=ALERTS_TTL_SECONDS)
+def _cached_hurricane_alerts(latitude: float, longitude: float) -> list:
+    """Get NWS hurricane alerts for a location, cached for a short TTL."""
+    return get_hurricane_alerts(latitude, longitude)
+
+
+def _prepare_cone(cone: NHCCone) -> None:
+    """Attach a prepared geometry and bounding box to a cone.
+
+    Prepared geometries build a GEOS edge index once so repeated
+    point-in-polygon and intersection tests avoid re-walking every edge.
+
+    Args:
+        cone: Storm cone to prepare in place
+    """
+    cone._prepared = prep(cone.geometry)
+    cone._bbox = cone.geometry.bounds
+    minx, miny, maxx, maxy = cone._bbox
+    cone._bbox_area = (maxx - minx) * (maxy - miny)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_county_polygon_cached(path_str: str, mtime: float) -> Polygon:
+    """Load a county polygon, memoized by path and modification time.
+
+    Args:
+        path_str: Path to county GeoJSON file
+        mtime: File modification time, so edits invalidate the cache
+
+    Returns:
+        County polygon
+    """
+    return load_county_polygon(Path(path_str))
+
+
+def _cone_text(cone: NHCCone) -> tuple[str, str, str]:
+    """Get a cone's lowercased name, type and id, caching them on the cone.
+
+    Args:
+        cone: Storm cone data
+
+    Returns:
+        Tuple of (name, type, id), each lowercased and never None
+    """
+    cached = getattr(cone, "_lc_text", None)
+    if cached is None:
+        cached = (
+            (cone.storm_name or "").lower(),
+            (cone.storm_type or "").lower(),
+            (cone.storm_id or "").lower(),
+        )
+        cone._lc_text = cached
+    return cached
+
+
+def _max_winds_of(cone: NHCCone) -> int:
+    """Get a cone's maximum winds as an integer, caching the parse on the cone.
+
+    Args:
+        cone: Storm cone data
+
+    Returns:
+        Maximum sustained winds (mph), or 0 if unknown
+    """
+    cached = getattr(cone, "_max_winds_int", None)
+    if cached is not None:
+        return cached
+
+    max_winds = cone.max_winds or 0
+
+    # Convert max_winds to integer if it's a string
+    if isinstance(max_winds, str):
+        try:
+            max_winds = int(max_winds)
+        except (ValueError, TypeError):
+            max_winds = 0
+
+    cone._max_winds_int = max_winds
+    return max_winds
+
+
+def _haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Calculate the great circle distance between two points.
+
+    Args:
+        lat1: First point latitude
+        lon1: First point longitude
+        lat2: Second point latitude
+        lon2: Second point longitude
+
+    Returns:
+        Distance in kilometers
+    """
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+    a = math.sin(dlat / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+# Alert level for each official event, in the precedence they are checked
+_EVENT_LEVELS = {
+    "hurricane warning": AlertLevel.HURRICANE_WARNING,
+    "hurricane watch": AlertLevel.TROPICAL_STORM_WARNING_HURRICANE_WATCH_EVACUATION,
+    "tropical storm warning": AlertLevel.TROPICAL_STORM_WARNING_HURRICANE_WATCH_EVACUATION,
+    "tropical storm watch": AlertLevel.TROPICAL_STORM_WATCH_HURRICANE_THREAT,
+}
+
+
+def _event_level(event: str) -> AlertLevel | None:
+    """Map a lowercased alert event to its alert level.
+
+    Args:
+        event: Lowercased alert event
+
+    Returns:
+        Alert level for the event, or None if it is not a tropical alert
+    """
+    level = _EVENT_LEVELS.get(event.strip())
+    if level is not None:
+        return level
+
+    # Events with extra wording, e.g. "Hurricane Warning for Nassau"
+    for phrase, phrase_level in _EVENT_LEVELS.items():
+        if phrase in event:
+            return phrase_level
+    return None
+
+
+def _normalize_alerts(nws_alerts: list) -> list[tuple[str, str, str]]:
+    """Lowercase alert text once for all per-storm checks.
+
+    Args:
+        nws_alerts: NWSAlert objects and NHC alert dicts
+
+    Returns:
+        Alerts as (event lower, description lower, event) tuples
+    """
+    alert_text = []
+    for alert in nws_alerts:
+        # NHC alerts are plain dicts; anything else is an NWSAlert
+        if isinstance(alert, dict):
+            event, description = alert.get("event", ""), alert.get("description", "")
+        else:
+            event, description = alert.event, alert.description
+        alert_text.append((event.lower(), (description or "").lower(), event))
+    return alert_text
+
 
 class StormCategory(Enum):
     """Enhanced storm categorization for precise threat assessment."""
@@ -30,7 +272,116 @@ class StormCategory(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+# Storm type keywords, in the precedence _categorize_storm gives them
+_STORM_TYPE_CATEGORIES = (
+    ("hurricane", StormCategory.HURRICANE_MINOR),
+    ("storm", StormCategory.TROPICAL_STORM),
+    ("depression", StormCategory.TROPICAL_DEPRESSION),
+    ("disturbance", StormCategory.INVEST_DISTURBANCE),
+    ("development", StormCategory.INVEST_DISTURBANCE),
+)
+
+# Category precedence when storm type and wind speed disagree
+_CATEGORY_RANK = {
+    StormCategory.HURRICANE_MINOR: 0,
+    StormCategory.TROPICAL_STORM: 1,
+    StormCategory.TROPICAL_DEPRESSION: 2,
+    StormCategory.INVEST_DISTURBANCE: 3,
+}
+
+# Numbered Atlantic systems such as AL09
+_ATLANTIC_ID_RE = re.compile(r"al\d", re.IGNORECASE)
+
+# Storm name patterns tried in order against lowercased advisory text
+_NAME_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r"hurricane\s+(\w+)",
+    r"tropical storm\s+(\w+)",
+    r"potential tropical cyclone\s+(\w+)",
+    r"(\w+)\s+advisory",
+))
+
+# Headers that open a tropical storm watch/warning section in an advisory
+_SECTION_HEADERS = (
+    ("tropical storm watch is in effect for", "watch"),
+    ("tropical storm warning is in effect for", "warning"),
+)
+
+
+def _find_section_mention(text: str, locations: tuple[str, ...]) -> str | None:
+    """Find the first location mentioned inside a tropical storm watch/warning section.
+
+    Header lines open a section and "A ... watch/warning means" lines close
+    it; locations named on either kind of line are not counted. Everything
+    before the first header is skipped with C-level find() calls, so only
+    the few lines from the summary onward are walked in Python.
+
+    Args:
+        text: Lowercased advisory text
+        locations: Lowercased location names to look for
+
+    Returns:
+        "watch" or "warning" for the section of the first mention, or None
+    """
+    first_header = -1
+    for header, _ in _SECTION_HEADERS:
+        index = text.find(header)
+        if index != -1 and (first_header == -1 or index < first_header):
+            first_header = index
+    if first_header == -1:
+        return None
+
+    section = None
+    for line in text[text.rfind("\n", 0, first_header) + 1:].split("\n"):
+        line = line.strip()
+        for header, header_section in _SECTION_HEADERS:
+            if header in line:
+                section = header_section
+                break
+        else:
+            if line.startswith("a ") and ("watch" in line or "warning" in line):
+                section = None
+            elif section is not None and any(location in line for location in locations):
+                return section
+    return None
+
+
+@dataclass(frozen=True)
+class _BahamasRegion:
+    """Part of the Bahamas whose watches/warnings are parsed by advisory section."""
+
+    bounds: tuple[float, float, float, float]  # (min_lat, max_lat, min_lon, max_lon)
+    locations: tuple[str, ...]
+    area: str
+
+    def contains(self, latitude: float, longitude: float) -> bool:
+        """Check whether a location falls inside this region's box."""
+        min_lat, max_lat, min_lon, max_lon = self.bounds
+        return min_lat <= latitude <= max_lat and min_lon <= longitude <= max_lon
+
+
+# (min_lat, max_lat, min_lon, max_lon) of the area NHC Bahamas alerts are checked for
+_BAHAMAS_ENVELOPE = (23.0, 27.0, -80.0, -72.0)
+
+# Checked in order, so Nassau wins where the boxes overlap
+_BAHAMAS_REGIONS = (
+    _BahamasRegion(
+        bounds=(24.5, 26.5, -78.5, -76.5),
+        locations=("northwestern bahamas", "new providence"),
+        area="northwestern Bahamas including New Providence",
+    ),
+    _BahamasRegion(
+        bounds=(23.0, 25.0, -77.0, -75.0),
+        locations=("central bahamas", "exuma"),
+        area="central Bahamas including Exuma",
+    ),
+)
+
+
+# ATCF invest identifiers (90-99), with or without the year suffix
+_INVEST_RE = re.compile(r"^(AL|EP|CP|WP)9\d(\d{4})?$", re.IGNORECASE)
+
+
+@dataclass(slots=True, eq=False)
 class StormThreat:
     """Comprehensive storm threat assessment."""
 
@@ -50,6 +401,17 @@ class EnhancedConeAnalyzer:
     def __init__(self) -> None:
         """Initialize the enhanced analyzer."""
         self.logger = logging.getLogger(__name__)
+        # Keep-alive session for NHC text products; advisories share one pool
+        self.session = requests.Session()
+        self.session.headers.update(_NHC_HEADERS)
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            max_retries=Retry(total=2, backoff_factor=0.3),
+        ))
+        # Spatial index over the most recently collected cones
+        self._tree: STRtree | None = None
+        self._tree_cones: list[NHCCone] = []
 
     def analyze_location_threat(
         self,
@@ -74,13 +436,50 @@ class EnhancedConeAnalyzer:
         # Get all active storm data with enhanced accuracy
         cones, geometries = self._get_enhanced_storm_data()
 
+        # Repeat polls of the same place against the same advisories reuse
+        # the last result; 3 decimal places is about 100 m
+        fingerprint = hash(tuple(sorted(
+            (cone.storm_id or "", cone.advisory_num or "") for cone in cones
+        )))
+        cache_key = (
+            round(latitude, 3), round(longitude, 3),
+            use_county_intersect, county_geojson_path, fingerprint,
+        )
+        cached = _analysis_cache.get(cache_key)
+        if cached is not None:
+            self.logger.debug("Reusing cached threat analysis")
+            return {
+                **cached,
+                "storm_threats": list(cached["storm_threats"]),
+                "nws_alerts": list(cached["nws_alerts"]),
+            }
+
         # Filter storms by distance to location (2000km radius for relevance)
         if cones:
             cones = self._filter_storms_by_distance(cones, (latitude, longitude), 2000.0)
             geometries = [cone.geometry for cone in cones if cone.geometry]
 
-        # Get official NWS alerts
+        # Get official NWS alerts and lowercase them once for every storm
         nws_alerts = self._get_nws_alerts(latitude, longitude)
+        alert_text = _normalize_alerts(nws_alerts)
+
+        # Load the county polygon once for every storm; fall back to a point
+        # check if it cannot be loaded
+        county_polygon = None
+        if use_county_intersect and county_geojson_path:
+            try:
+                county_path = Path(county_geojson_path)
+                county_polygon = prep(
+                    _load_county_polygon_cached(str(county_path), county_path.stat().st_mtime)
+                )
+            except Exception as e:
+                self.logger.warning(f"County polygon unavailable, using point check: {e}")
+
+        # Build the location point once and prune cones by envelope before
+        # any exact intersection test
+        query_point = Point(longitude, latitude)
+        query_geometry = county_polygon.context if county_polygon else query_point
+        candidates = self._query_candidate_cones(query_geometry)
 
         # Analyze each storm threat
         storm_threats = []
@@ -90,7 +489,8 @@ class EnhancedConeAnalyzer:
         for cone, geometry in zip(cones, geometries, strict=False):
             threat = self._analyze_storm_threat(
                 cone, geometry, latitude, longitude,
-                use_county_intersect, county_geojson_path, nws_alerts
+                county_polygon, alert_text,
+                candidates=candidates, query_point=query_point,
             )
 
             if threat.in_cone:
@@ -103,18 +503,24 @@ class EnhancedConeAnalyzer:
 
         # Apply NWS alert overrides
         if nws_alerts:
-            highest_threat = self._apply_nws_overrides(highest_threat, nws_alerts)
+            highest_threat = self._apply_nws_overrides(highest_threat, alert_text)
 
         self.logger.info(f"Analysis complete: {len(storm_threats)} threatening storms, "
                         f"highest threat: {highest_threat.name}")
 
-        return {
+        result = {
             "alert_level": highest_threat,
             "storm_threats": storm_threats,
             "is_in_any_cone": is_in_any_cone,
             "nws_alerts": nws_alerts,
             "total_storms_analyzed": len(cones),
         }
+        _analysis_cache.set(cache_key, {
+            **result,
+            "storm_threats": list(storm_threats),
+            "nws_alerts": list(nws_alerts),
+        })
+        return result
 
     def _get_enhanced_storm_data(self) -> tuple[list[NHCCone], list[BaseGeometry]]:
         """Get enhanced storm data from multiple sources with fallbacks.
@@ -124,9 +530,18 @@ class EnhancedConeAnalyzer:
         """
         enhanced_cones = []
 
+        # The sources are independent, so fetch them concurrently. Results are
+        # still merged below in priority order, and .result() re-raises any
+        # fetch error into the matching handler.
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            storm_cones_future = executor.submit(_cached_storm_cones)
+            current_storms_future = executor.submit(_cached_current_storms)
+            atcf_future = executor.submit(_cached_atcf_positions)
+            active_cones_future = executor.submit(_cached_active_cones)
+
         # Priority 1: Individual storm tracking pages (most complete cone data)
         try:
-            individual_storm_cones = get_all_active_storm_cones()
+            individual_storm_cones = storm_cones_future.result()
             if individual_storm_cones:
                 enhanced_cones.extend(individual_storm_cones)
                 self.logger.info(f"Retrieved {len(individual_storm_cones)} cones from individual storm pages")
@@ -135,7 +550,7 @@ class EnhancedConeAnalyzer:
 
         # Priority 2: Named storms from CurrentStorms.json (metadata enhancement)
         try:
-            current_storms = get_current_storms_with_positions()
+            current_storms = current_storms_future.result()
             if current_storms:
                 # Merge with individual storm data to avoid duplicates
                 existing_ids = {cone.storm_id for cone in enhanced_cones if cone.storm_id}
@@ -148,7 +563,7 @@ class EnhancedConeAnalyzer:
 
         # Priority 2: ATCF invest positions for disturbances
         try:
-            atcf_positions = get_atcf_invest_positions()
+            atcf_positions = atcf_future.result()
             if atcf_positions:
                 self.logger.info(f"Retrieved {len(atcf_positions)} ATCF invest positions")
                 # Enhance existing cones with ATCF data
@@ -158,7 +573,7 @@ class EnhancedConeAnalyzer:
 
         # Priority 3: MapServer fallback for any missing data
         try:
-            all_cones, _all_geometries = get_active_cones()
+            all_cones, _all_geometries = active_cones_future.result()
 
             # Add any cones not already captured
             existing_ids = {cone.storm_id for cone in enhanced_cones if cone.storm_id}
@@ -172,11 +587,48 @@ class EnhancedConeAnalyzer:
             self.logger.error(f"MapServer fallback failed: {e}")
             # Use whatever we have
 
+        # Prepare geometries once so per-location intersection tests are cheap
+        for cone in enhanced_cones:
+            if cone.geometry is not None and getattr(cone, "_prepared", None) is None:
+                try:
+                    _prepare_cone(cone)
+                except Exception as e:
+                    self.logger.debug("Could not prepare geometry for %s: %s", cone.storm_id, e)
+
         # Extract geometries
         geometries = [cone.geometry for cone in enhanced_cones]
 
+        # Index cone envelopes so location queries only test nearby cones
+        try:
+            self._tree = STRtree(geometries)
+            self._tree_cones = enhanced_cones
+        except Exception as e:
+            self.logger.debug(f"Could not build cone index: {e}")
+            self._tree = None
+            self._tree_cones = []
+
         return enhanced_cones, geometries
 
+    def _query_candidate_cones(self, query_geometry: BaseGeometry) -> set[int] | None:
+        """Find cones whose envelope intersects a query geometry.
+
+        Args:
+            query_geometry: Point or polygon to query the cone index with
+
+        Returns:
+            Set of candidate cone ids (``id(cone)``), or None if no index is available
+        """
+        if self._tree is None:
+            return None
+
+        try:
+            indices = self._tree.query(query_geometry)
+        except Exception as e:
+            self.logger.debug(f"Cone index query failed: {e}")
+            return None
+
+        return {id(self._tree_cones[index]) for index in indices.tolist()}
+
     def _enhance_with_atcf_data(
         self,
         cones: list[NHCCone],
@@ -189,25 +641,29 @@ class EnhancedConeAnalyzer:
             atcf_positions: ATCF position data
 
         Returns:
-            Enhanced cone list
+            Enhanced cone list (the input list, updated in place)
         """
-        enhanced = cones.copy()
+        # Index existing cones once; the first cone wins for duplicate ids
+        by_id: dict[str, NHCCone] = {}
+        for cone in cones:
+            if cone.storm_id:
+                by_id.setdefault(cone.storm_id, cone)
+        name_index = [(_cone_text(cone)[0], cone) for cone in cones if cone.storm_name]
 
         for invest_id, position in atcf_positions.items():
-            # Check if we already have this invest
-            found = False
-            for cone in enhanced:
-                if (cone.storm_id == invest_id or
-                    (cone.storm_name and invest_id.lower() in cone.storm_name.lower())):
-                    # Update with precise ATCF position
-                    cone.current_position = position
-                    found = True
-                    break
-
-            if not found:
-                # Create new cone for ATCF invest
-                from shapely.geometry import Point
-                point_geom = Point(position[1], position[0]).buffer(2.0)  # 2-degree buffer
+            # Check if we already have this invest, preferring an exact id match
+            match = by_id.get(invest_id)
+            if match is None:
+                invest_lower = invest_id.lower()
+                match = next((cone for name, cone in name_index if invest_lower in name), None)
+
+            if match is not None:
+                # Update with precise ATCF position
+                match.current_position = position
+            else:
+                # Create new cone for ATCF invest; 8 segments per quadrant keeps
+                # the circle within ~1 km of true at a quarter of the vertices
+                point_geom = Point(position[1], position[0]).buffer(2.0, quad_segs=8)  # 2-degree buffer
 
                 new_cone = NHCCone(
                     geometry=point_geom,
@@ -217,10 +673,10 @@ class EnhancedConeAnalyzer:
                     current_position=position,
                     advisory_num="ATCF"
                 )
-                enhanced.append(new_cone)
+                cones.append(new_cone)
                 self.logger.info(f"Added ATCF invest {invest_id} at {position}")
 
-        return enhanced
+        return cones
 
     def _analyze_storm_threat(
         self,
@@ -228,9 +684,11 @@ class EnhancedConeAnalyzer:
         geometry: BaseGeometry,
         latitude: float,
         longitude: float,
-        use_county_intersect: bool,
-        county_geojson_path: str | None,
-        nws_alerts: list[dict],
+        county_polygon: PreparedGeometry | None,
+        alert_text: list[tuple[str, str, str]],
+        *,
+        candidates: set[int] | None = None,
+        query_point: Point | None = None,
     ) -> StormThreat:
         """Analyze threat from a specific storm.
 
@@ -239,16 +697,18 @@ class EnhancedConeAnalyzer:
             geometry: Cone geometry
             latitude: Target latitude
             longitude: Target longitude
-            use_county_intersect: Use county intersection
-            county_geojson_path: County GeoJSON path
-            nws_alerts: NWS alerts
+            county_polygon: Prepared county polygon for county intersection, or None
+            alert_text: NWS alerts as (event lower, description lower, event) tuples
+            candidates: Optional ids of cones that passed the index query
+            query_point: Optional prebuilt Point for the target location
 
         Returns:
             Storm threat assessment
         """
         # Check intersection with high precision
         in_cone = self._check_precise_intersection(
-            geometry, latitude, longitude, use_county_intersect, county_geojson_path, cone
+            geometry, latitude, longitude, county_polygon, cone,
+            candidates=candidates, query_point=query_point,
         )
 
         # Categorize storm
@@ -258,13 +718,13 @@ class EnhancedConeAnalyzer:
         distance_km = self._calculate_distance(cone, latitude, longitude)
 
         # Determine threat level
-        threat_level = self._determine_threat_level(cone, category, in_cone, nws_alerts)
+        threat_level = self._determine_threat_level(cone, category, in_cone, alert_text)
 
         # Calculate confidence
         confidence = self._calculate_confidence(cone, category, in_cone)
 
         # Get relevant warnings
-        warnings = self._get_relevant_warnings(cone, nws_alerts)
+        warnings = self._get_relevant_warnings(cone, alert_text)
 
         # Estimate arrival time
         arrival_hours = self._estimate_arrival_time(cone, latitude, longitude)
@@ -285,9 +745,11 @@ class EnhancedConeAnalyzer:
         geometry: BaseGeometry,
         latitude: float,
         longitude: float,
-        use_county_intersect: bool,
-        county_geojson_path: str | None,
+        county_polygon: PreparedGeometry | None = None,
         cone: NHCCone | None = None,
+        *,
+        candidates: set[int] | None = None,
+        query_point: Point | None = None,
     ) -> bool:
         """Check intersection with maximum precision.
 
@@ -295,23 +757,44 @@ class EnhancedConeAnalyzer:
             geometry: Cone geometry
             latitude: Target latitude
             longitude: Target longitude
-            use_county_intersect: Use county intersection
-            county_geojson_path: County GeoJSON path
+            county_polygon: Prepared county polygon for county intersection, or None
             cone: Optional cone data for smarter filtering
+            candidates: Optional ids of cones that passed the index query
+            query_point: Optional prebuilt Point for the target location
 
         Returns:
             True if location intersects cone
         """
+        # Cones the spatial index ruled out cannot intersect the location
+        if candidates is not None and cone is not None and id(cone) not in candidates:
+            return False
+
+        # Bounding-box reject: a few float compares instead of any GEOS call
+        bbox = getattr(cone, "_bbox", None)
+        if bbox is not None:
+            minx, miny, maxx, maxy = bbox
+            if county_polygon is not None:
+                cminx, cminy, cmaxx, cmaxy = county_polygon.context.bounds
+                if cmaxx < minx or cminx > maxx or cmaxy < miny or cminy > maxy:
+                    return False
+            elif not (minx <= longitude <= maxx and miny <= latitude <= maxy):
+                return False
+
         try:
             # Smart filtering: Only filter out large areas for unnamed disturbances
-            # Named storms and PTCs should always be checked regardless of size
-            if hasattr(geometry, 'area') and geometry.area > 50.0:
+            # Named storms and PTCs should always be checked regardless of size.
+            # The real area never exceeds the bounding-box area, so only cones
+            # with a large bbox need the full GEOS area computation.
+            bbox_area = getattr(cone, "_bbox_area", None)
+            if bbox_area is None:
+                minx, miny, maxx, maxy = geometry.bounds
+                bbox_area = (maxx - minx) * (maxy - miny)
+            area = geometry.area if bbox_area > 50.0 else 0.0
+            if area > 50.0:
                 # Check if this is a named storm or PTC
                 is_named_storm = False
                 if cone:
-                    storm_name = (cone.storm_name or "").lower()
-                    storm_type = (cone.storm_type or "").lower()
-                    storm_id = (cone.storm_id or "").lower()
+                    storm_name, storm_type, storm_id = _cone_text(cone)
 
                     # Allow named storms, PTCs, and numbered systems (AL09, etc.)
                     is_named_storm = (
@@ -321,25 +804,30 @@ class EnhancedConeAnalyzer:
                         "potential tropical cyclone" in storm_type or
                         "cyclone" in storm_name or
                         bool(storm_name and storm_name not in ["unknown", "invest"]) or
-                        (storm_id and any(char.isdigit() for char in storm_id) and "al" in storm_id)
+                        bool(_ATLANTIC_ID_RE.search(storm_id))
                     )
 
                 if not is_named_storm:
-                    self.logger.debug(f"Skipping large development area (area: {geometry.area:.2f} sq deg)")
+                    self.logger.debug("Skipping large development area (area: %.2f sq deg)", area)
                     return False
-                self.logger.debug(f"Allowing large named storm cone (area: {geometry.area:.2f} sq deg)")
+                self.logger.debug("Allowing large named storm cone (area: %.2f sq deg)", area)
+
+
+            if county_polygon is not None:
+                return county_polygon.intersects(geometry)
 
+            prepared = getattr(cone, "_prepared", None)
+            if prepared is not None:
+                # intersects() keeps boundary points inside, matching point_in_any
+                if query_point is None:
+                    query_point = Point(longitude, latitude)
+                return prepared.intersects(query_point)
 
-            if use_county_intersect and county_geojson_path:
-                from pathlib import Path
-                county_path = Path(county_geojson_path) if isinstance(county_geojson_path, str) else county_geojson_path
-                county_polygon = load_county_polygon(county_path)
-                return polygon_intersects_any([geometry], county_polygon)
             # High-precision point check
             point = (longitude, latitude)  # Note: lon, lat order for Shapely
             return point_in_any([geometry], point)
         except Exception as e:
-            self.logger.debug(f"Intersection check failed: {e}")
+            self.logger.debug("Intersection check failed: %s", e)
             # Fallback to simple point check
             point = (longitude, latitude)
             return point_in_any([geometry], point)
@@ -355,55 +843,77 @@ class EnhancedConeAnalyzer:
         Returns:
             Filtered list of relevant storms
         """
-        from math import asin, cos, radians, sin, sqrt
-
-        def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-            """Calculate the great circle distance between two points in km."""
-            # Convert decimal degrees to radians
-            lat1, lon1, lat2, lon2 = map(radians, [lat1, lon1, lat2, lon2])
-
-            # Haversine formula
-            dlat = lat2 - lat1
-            dlon = lon2 - lon1
-            a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
-            c = 2 * asin(sqrt(a))
-            r = 6371  # Radius of earth in kilometers
-            return c * r
-
         target_lat, target_lon = location
         relevant_storms = []
 
-        for cone in cones:
-            if cone.current_position is not None and len(cone.current_position) == 2:
-                storm_lat, storm_lon = cone.current_position
-                distance = haversine_distance(target_lat, target_lon, storm_lat, storm_lon)
+        positioned = {
+            index: cone.current_position
+            for index, cone in enumerate(cones)
+            if cone.current_position is not None and len(cone.current_position) == 2
+        }
+        distances: dict[int, float] = {}
+        if positioned:
+            indices = np.fromiter(positioned, int, len(positioned))
+            lats = np.fromiter((pos[0] for pos in positioned.values()), float, len(positioned))
+            lons = np.fromiter((pos[1] for pos in positioned.values()), float, len(positioned))
+
+            # Equirectangular prefilter rejects distant storms without haversine trig
+            dlat = lats - target_lat
+            dlon = (lons - target_lon + 180.0) % 360.0 - 180.0
+            x = dlon * np.cos(np.deg2rad((lats + target_lat) / 2))
+            approx_km = KM_PER_DEGREE * np.sqrt(x * x + dlat * dlat)
+            near = approx_km <= max_distance_km * PREFILTER_MARGIN
+
+            # Exact vectorized haversine for the storms that survive
+            lats_rad = np.deg2rad(lats[near])
+            lons_rad = np.deg2rad(lons[near])
+            tlat_rad, tlon_rad = np.deg2rad(target_lat), np.deg2rad(target_lon)
+            a = (np.sin((lats_rad - tlat_rad) / 2) ** 2 +
+                 np.cos(tlat_rad) * np.cos(lats_rad) * np.sin((lons_rad - tlon_rad) / 2) ** 2)
+            dist_km = 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+            distances = dict(zip(indices[near].tolist(), dist_km.tolist(), strict=True))
+
+        for index, cone in enumerate(cones):
+            if index in distances:
+                distance = distances[index]
+
+                # Cache for _calculate_distance so the per-storm pass reuses it.
+                # One tuple keeps key and value consistent when analyses share cones.
+                cone._distance_cache = ((target_lat, target_lon, cone.current_position), distance)
 
                 # Always include storms that are close or have cones that might affect the location
                 if distance <= max_distance_km:
                     relevant_storms.append(cone)
-                    self.logger.debug(f"Including {cone.storm_name or cone.storm_id}: {distance:.0f}km away")
+                    self.logger.debug("Including %s: %.0fkm away", cone.storm_name or cone.storm_id, distance)
                 else:
-                    self.logger.debug(f"Excluding {cone.storm_name or cone.storm_id}: {distance:.0f}km away (too far)")
+                    self.logger.debug("Excluding %s: %.0fkm away (too far)", cone.storm_name or cone.storm_id, distance)
+            elif index in positioned:
+                self.logger.debug(
+                    "Excluding %s: well beyond %.0fkm (too far)", cone.storm_name or cone.storm_id, max_distance_km
+                )
             # Include storms without position data (better safe than sorry)
             # Also try to estimate position from geometry centroid if available
             elif hasattr(cone, 'geometry') and cone.geometry is not None:
                 try:
                     centroid = cone.geometry.centroid
-                    storm_lat, storm_lon = centroid.y, centroid.x
-                    distance = haversine_distance(target_lat, target_lon, storm_lat, storm_lon)
+                    distance = _haversine_km(target_lat, target_lon, centroid.y, centroid.x)
 
                     if distance <= max_distance_km:
                         relevant_storms.append(cone)
-                        self.logger.debug(f"Including {cone.storm_name or cone.storm_id}: {distance:.0f}km away (from centroid)")
+                        self.logger.debug(
+                            "Including %s: %.0fkm away (from centroid)", cone.storm_name or cone.storm_id, distance
+                        )
                     else:
-                        self.logger.debug(f"Excluding {cone.storm_name or cone.storm_id}: {distance:.0f}km away (from centroid)")
+                        self.logger.debug(
+                            "Excluding %s: %.0fkm away (from centroid)", cone.storm_name or cone.storm_id, distance
+                        )
                 except Exception:
                     # If centroid calculation fails, include the storm anyway
                     relevant_storms.append(cone)
-                    self.logger.debug(f"Including {cone.storm_name or cone.storm_id}: no position data, centroid failed")
+                    self.logger.debug("Including %s: no position data, centroid failed", cone.storm_name or cone.storm_id)
             else:
                 relevant_storms.append(cone)
-                self.logger.debug(f"Including {cone.storm_name or cone.storm_id}: no position or geometry data")
+                self.logger.debug("Including %s: no position or geometry data", cone.storm_name or cone.storm_id)
 
         return relevant_storms
 
@@ -416,34 +926,34 @@ class EnhancedConeAnalyzer:
         Returns:
             Storm category
         """
-        storm_type = (cone.storm_type or "").lower()
-        storm_name = (cone.storm_name or "").lower()
-        max_winds = cone.max_winds or 0
-
-        # Convert max_winds to integer if it's a string
-        if isinstance(max_winds, str):
-            try:
-                max_winds = int(max_winds)
-            except (ValueError, TypeError):
-                max_winds = 0
-
-        # Hurricane categorization
-        if "hurricane" in storm_type or max_winds >= 74:
-            if max_winds >= 111:  # Category 3+
-                return StormCategory.HURRICANE_MAJOR
-            return StormCategory.HURRICANE_MINOR
-
-        # Tropical Storm
-        if "tropical storm" in storm_type or "storm" in storm_type or (39 <= max_winds < 74):
-            return StormCategory.TROPICAL_STORM
-
-        # Tropical Depression
-        if "depression" in storm_type or (0 < max_winds < 39):
-            return StormCategory.TROPICAL_DEPRESSION
+        storm_name, storm_type, _ = _cone_text(cone)
+        max_winds = _max_winds_of(cone)
+
+        # Category 3+ winds outrank every other signal
+        if max_winds >= 111:
+            return StormCategory.HURRICANE_MAJOR
+
+        # Wind-based category
+        category = None
+        if max_winds >= 74:
+            category = StormCategory.HURRICANE_MINOR
+        elif max_winds >= 39:
+            category = StormCategory.TROPICAL_STORM
+        elif max_winds > 0:
+            category = StormCategory.TROPICAL_DEPRESSION
+
+        # Type-based category; the first keyword hit is the strongest one
+        for keyword, type_category in _STORM_TYPE_CATEGORIES:
+            if keyword in storm_type:
+                if category is None or _CATEGORY_RANK[type_category] < _CATEGORY_RANK[category]:
+                    category = type_category
+                break
+
+        if category is not None:
+            return category
 
         # Invest/Disturbance
-        if ("invest" in storm_name or "disturbance" in storm_type or
-            "development" in storm_type or (cone.storm_id and "9" in cone.storm_id)):
+        if "invest" in storm_name or _INVEST_RE.match(cone.storm_id or ""):
             return StormCategory.INVEST_DISTURBANCE
 
         # Development area
@@ -457,7 +967,7 @@ class EnhancedConeAnalyzer:
         cone: NHCCone,
         category: StormCategory,
         in_cone: bool,
-        nws_alerts: list[dict],
+        alert_text: list[tuple[str, str, str]],
     ) -> AlertLevel:
         """Determine precise threat level.
 
@@ -465,7 +975,7 @@ class EnhancedConeAnalyzer:
             cone: Storm cone data
             category: Storm category
             in_cone: Whether location is in cone
-            nws_alerts: NWS alerts
+            alert_text: NWS alerts as (event lower, description lower, event) tuples
 
         Returns:
             Alert level
@@ -474,21 +984,10 @@ class EnhancedConeAnalyzer:
             return AlertLevel.ALL_CLEAR
 
         # Check for official warnings first
-        for alert in nws_alerts:
-            # Handle both NWSAlert objects and dict objects
-            if hasattr(alert, 'event'):
-                # NWSAlert object
-                event = alert.event.lower()
-            else:
-                # Dict object
-                event = alert.get("event", "").lower()
-
-            if "hurricane warning" in event:
-                return AlertLevel.HURRICANE_WARNING
-            if "hurricane watch" in event or "tropical storm warning" in event:
-                return AlertLevel.TROPICAL_STORM_WARNING_HURRICANE_WATCH_EVACUATION
-            if "tropical storm watch" in event:
-                return AlertLevel.TROPICAL_STORM_WATCH_HURRICANE_THREAT
+        for event, _, _ in alert_text:
+            level = _event_level(event)
+            if level is not None:
+                return level
 
         # Determine based on storm category
         if category == StormCategory.HURRICANE_MAJOR:
@@ -521,25 +1020,13 @@ class EnhancedConeAnalyzer:
         if not cone.current_position:
             return None
 
-        storm_lat, storm_lon = cone.current_position
-
-        # Haversine formula for great circle distance
-        import math
+        # Reuse the distance computed by _filter_storms_by_distance when valid
+        cached = getattr(cone, "_distance_cache", None)
+        if cached is not None and cached[0] == (latitude, longitude, cone.current_position):
+            return cached[1]
 
-        lat1, lon1 = math.radians(latitude), math.radians(longitude)
-        lat2, lon2 = math.radians(storm_lat), math.radians(storm_lon)
-
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
-
-        a = (math.sin(dlat/2)**2 +
-             math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2)
-        c = 2 * math.asin(math.sqrt(a))
-
-        # Earth radius in kilometers
-        r = 6371
-
-        return c * r
+        storm_lat, storm_lon = cone.current_position
+        return _haversine_km(latitude, longitude, storm_lat, storm_lon)
 
     def _calculate_confidence(
         self,
@@ -560,7 +1047,7 @@ class EnhancedConeAnalyzer:
         confidence = 0.5  # Base confidence
 
         # Higher confidence for named storms
-        if cone.storm_name and "unknown" not in cone.storm_name.lower():
+        if cone.storm_name and "unknown" not in _cone_text(cone)[0]:
             confidence += 0.2
 
         # Higher confidence for recent advisories
@@ -581,31 +1068,21 @@ class EnhancedConeAnalyzer:
     def _get_relevant_warnings(
         self,
         cone: NHCCone,
-        nws_alerts: list[dict]
+        alert_text: list[tuple[str, str, str]],
     ) -> list[str]:
         """Get warnings relevant to this storm.
 
         Args:
             cone: Storm cone data
-            nws_alerts: NWS alerts
+            alert_text: NWS alerts as (event lower, description lower, event) tuples
 
         Returns:
             List of relevant warning descriptions
         """
         warnings = []
-        storm_name = (cone.storm_name or "").lower()
-
-        for alert in nws_alerts:
-            # Handle both NWSAlert objects and dict objects
-            if hasattr(alert, 'description'):
-                # NWSAlert object
-                alert_desc = alert.description.lower()
-                event = alert.event
-            else:
-                # Dict object
-                alert_desc = alert.get("description", "").lower()
-                event = alert.get("event", "")
+        storm_name = _cone_text(cone)[0]
 
+        for _, alert_desc, event in alert_text:
             if storm_name and storm_name in alert_desc:
                 warnings.append(event)
 
@@ -635,16 +1112,17 @@ class EnhancedConeAnalyzer:
             return None
 
         # Parse movement for speed (rough estimate)
-        movement = cone.movement.lower()
         speed_kph = 15  # Default 15 km/h
 
         # Try to extract speed from movement string
-        import re
-        speed_match = re.search(r'(\d+)\s*(?:mph|kph|km/h|knots)', movement)
+        speed_match = _SPEED_RE.search(cone.movement)
         if speed_match:
             speed = int(speed_match.group(1))
-            if 'mph' in movement or 'knots' in movement:
-                speed_kph = speed * 1.6  # Convert to km/h
+            unit = speed_match.group(2).lower()
+            if unit == "mph":
+                speed_kph = speed * 1.609  # Convert to km/h
+            elif unit == "knots":
+                speed_kph = speed * 1.852
             else:
                 speed_kph = speed
 
@@ -665,7 +1143,7 @@ class EnhancedConeAnalyzer:
         """
         try:
             # Try NWS first (for US locations)
-            nws_alerts = get_hurricane_alerts(latitude, longitude)
+            nws_alerts = _cached_hurricane_alerts(latitude, longitude)
 
             # For international locations (like Bahamas), also check NHC text products
             nhc_alerts = self._get_nhc_alerts_for_location(latitude, longitude)
@@ -687,297 +1165,366 @@ class EnhancedConeAnalyzer:
         Returns:
             List of NHC alerts in NWS-compatible format
         """
-        alerts = []
+        # Check if location is in Bahamas region (expanded to include central Bahamas)
+        min_lat, max_lat, min_lon, max_lon = _BAHAMAS_ENVELOPE
+        if not (min_lat <= latitude <= max_lat and min_lon <= longitude <= max_lon):
+            return []  # Only check for Bahamas region
 
-        try:
-            import requests
+        alerts = []
+        # The same storm's alert can appear in several products
+        seen: set[tuple[str, str | None]] = set()
 
-            # Check if location is in Bahamas region (expanded to include central Bahamas)
-            if not (23.0 <= latitude <= 27.0 and -80.0 <= longitude <= -72.0):
-                return alerts  # Only check for Bahamas region
+        def add_alerts(new_alerts: list[dict]) -> None:
+            for alert in new_alerts:
+                key = (alert["event"], alert.get("storm"))
+                if key not in seen:
+                    seen.add(key)
+                    alerts.append(alert)
 
-            # Get current NHC text products for active storms
-            headers = {"User-Agent": "weatherbot (alerts@example.com)"}
+        try:
+            # Nassau and Exuma get section-level parsing; elsewhere is general
+            region = next(
+                (region for region in _BAHAMAS_REGIONS if region.contains(latitude, longitude)), None
+            )
 
             # Try to get current storm advisories that might mention Bahamas
             try:
                 # Get the tropical weather outlook
-                outlook_url = "https://www.nhc.noaa.gov/text/refresh/MIATWOAT+shtml/latest.shtml"
-                response = requests.get(outlook_url, headers=headers, timeout=15)
-
-                if response.status_code == 200:
-                    text = response.text.lower()
-
-                    # Look for Bahamas mentions with watches/warnings
-                    if "bahamas" in text or "nassau" in text:
-                        if "tropical storm watch" in text:
-                            alerts.append({
-                                "event": "Tropical Storm Watch",
-                                "description": "Tropical Storm Watch in effect for portions of the Bahamas",
-                                "severity": "Moderate",
-                                "urgency": "Expected",
-                                "source": "NHC"
-                            })
-                        if "tropical storm warning" in text:
-                            alerts.append({
-                                "event": "Tropical Storm Warning",
-                                "description": "Tropical Storm Warning in effect for portions of the Bahamas",
-                                "severity": "Moderate",
-                                "urgency": "Immediate",
-                                "source": "NHC"
-                            })
-                        if "hurricane watch" in text:
-                            alerts.append({
-                                "event": "Hurricane Watch",
-                                "description": "Hurricane Watch in effect for portions of the Bahamas",
-                                "severity": "Severe",
-                                "urgency": "Expected",
-                                "source": "NHC"
-                            })
-                        if "hurricane warning" in text:
-                            alerts.append({
-                                "event": "Hurricane Warning",
-                                "description": "Hurricane Warning in effect for portions of the Bahamas",
-                                "severity": "Extreme",
-                                "urgency": "Immediate",
-                                "source": "NHC"
-                            })
-
+                add_alerts(self._get_outlook_alerts(_NHC_OUTLOOK_URL, _NHC_HEADERS))
             except Exception as e:
-                self.logger.debug(f"Could not check NHC outlook: {e}")
+                self.logger.debug("Could not check NHC outlook: %s", e)
 
             # Also check individual storm advisories
             try:
-                # Check specific storm advisories that might affect Bahamas
-                # PTC Nine is currently AT4, so check that advisory
-                storm_advisories = [
-                    "https://www.nhc.noaa.gov/text/refresh/MIATCPAT4+shtml/latest.shtml",  # PTC Nine
-                    "https://www.nhc.noaa.gov/text/refresh/MIATCPAT3+shtml/latest.shtml",  # Humberto
-                    "https://www.nhc.noaa.gov/text/refresh/MIATCPAT1+shtml/latest.shtml",  # AT1
-                    "https://www.nhc.noaa.gov/text/refresh/MIATCPAT2+shtml/latest.shtml",  # AT2
-                    "https://www.nhc.noaa.gov/text/refresh/MIATCPAT5+shtml/latest.shtml",  # AT5
-                ]
-
-                for advisory_url in storm_advisories:
+                # Only active Atlantic storms have current advisories; if
+                # CurrentStorms.json is unavailable, check every bin
+                active_bins = _cached_atlantic_bins()
+                if active_bins is not None:
+                    storm_advisories = [_ADVISORY_URL_TEMPLATE.format(bin=bin_number) for bin_number in active_bins]
+                else:
+                    storm_advisories = _STORM_ADVISORY_URLS
+
+                # Fetch every advisory at once; one failed request must not
+                # stop the others from being parsed
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    advisory_futures = [
+                        (advisory_url, executor.submit(self._get_advisory_text, advisory_url, _NHC_HEADERS))
+                        for advisory_url in storm_advisories
+                    ]
+
+                for advisory_url, adv_future in advisory_futures:
                     try:
-                        adv_response = requests.get(advisory_url, headers=headers, timeout=10)
-                        if adv_response.status_code == 200:
-                            adv_text = adv_response.text.lower()
-
-                            # Check if this advisory mentions Bahamas
-                            if "bahamas" in adv_text or "nassau" in adv_text:
-                                self.logger.debug(f"Found Bahamas mention in {advisory_url}")
-
-                                # Extract storm name from the advisory
-                                storm_name = "Unknown Storm"
-                                try:
-                                    # Look for storm name patterns in the text
-                                    import re
-                                    name_patterns = [
-                                        r'hurricane\s+(\w+)',
-                                        r'tropical storm\s+(\w+)',
-                                        r'potential tropical cyclone\s+(\w+)',
-                                        r'(\w+)\s+advisory'
-                                    ]
-                                    for pattern in name_patterns:
-                                        match = re.search(pattern, adv_text)
-                                        if match:
-                                            storm_name = match.group(1).title()
-                                            break
-                                except:
-                                    pass
-
-                                # Parse watches and warnings more precisely
-                                # Check if this location is specifically mentioned in watch/warning areas
-
-                                # For Nassau/New Providence (northwestern Bahamas)
-                                if latitude >= 24.5 and latitude <= 26.5 and longitude >= -78.5 and longitude <= -76.5:
-                                    # Nassau area - check ONLY northwestern Bahamas alerts
-                                    # Parse the text more carefully to distinguish between central and northwestern
-
-                                    # Look for the specific watch/warning sections
-                                    lines = adv_text.split('\n')
-                                    in_watch_section = False
-                                    in_warning_section = False
-
-                                    for line in lines:
-                                        line_clean = line.strip().lower()
-
-                                        # Identify sections
-                                        if "tropical storm watch is in effect for" in line_clean:
-                                            in_watch_section = True
-                                            in_warning_section = False
-                                            continue
-                                        if "tropical storm warning is in effect for" in line_clean:
-                                            in_warning_section = True
-                                            in_watch_section = False
-                                            continue
-                                        if line_clean.startswith("a ") and ("watch" in line_clean or "warning" in line_clean):
-                                            in_watch_section = False
-                                            in_warning_section = False
-                                            continue
-
-                                        # Check if Nassau/New Providence is mentioned in the current section
-                                        if in_watch_section and ("northwestern bahamas" in line_clean or "new providence" in line_clean):
-                                            alerts.append({
-                                                "event": "Tropical Storm Watch",
-                                                "description": "Tropical Storm Watch in effect for northwestern Bahamas including New Providence",
-                                                "severity": "Moderate",
-                                                "urgency": "Expected",
-                                                "source": "NHC",
-                                                "storm": storm_name
-                                            })
-                                            break  # Only add once
-
-                                        if in_warning_section and ("northwestern bahamas" in line_clean or "new providence" in line_clean):
-                                            alerts.append({
-                                                "event": "Tropical Storm Warning",
-                                                "description": "Tropical Storm Warning in effect for northwestern Bahamas including New Providence",
-                                                "severity": "Moderate",
-                                                "urgency": "Immediate",
-                                                "source": "NHC",
-                                                "storm": storm_name
-                                            })
-                                            break  # Only add once
-
-                                # For Exuma and central Bahamas (central Bahamas)
-                                elif latitude >= 23.0 and latitude <= 25.0 and longitude >= -77.0 and longitude <= -75.0:
-                                    # Central Bahamas area - check for central Bahamas alerts
-                                    # Parse the text more carefully to distinguish between central and northwestern
-
-                                    # Look for the specific watch/warning sections
-                                    lines = adv_text.split('\n')
-                                    in_watch_section = False
-                                    in_warning_section = False
-
-                                    for line in lines:
-                                        line_clean = line.strip().lower()
-
-                                        # Identify sections
-                                        if "tropical storm watch is in effect for" in line_clean:
-                                            in_watch_section = True
-                                            in_warning_section = False
-                                            continue
-                                        if "tropical storm warning is in effect for" in line_clean:
-                                            in_warning_section = True
-                                            in_watch_section = False
-                                            continue
-                                        if line_clean.startswith("a ") and ("watch" in line_clean or "warning" in line_clean):
-                                            in_watch_section = False
-                                            in_warning_section = False
-                                            continue
-
-                                        # Check if central Bahamas/Exuma is mentioned in the current section
-                                        if in_watch_section and ("central bahamas" in line_clean or "exuma" in line_clean or "exumas" in line_clean):
-                                            alerts.append({
-                                                "event": "Tropical Storm Watch",
-                                                "description": "Tropical Storm Watch in effect for central Bahamas including Exuma",
-                                                "severity": "Moderate",
-                                                "urgency": "Expected",
-                                                "source": "NHC",
-                                                "storm": storm_name
-                                            })
-                                            break  # Only add once
-
-                                        if in_warning_section and ("central bahamas" in line_clean or "exuma" in line_clean or "exumas" in line_clean):
-                                            alerts.append({
-                                                "event": "Tropical Storm Warning",
-                                                "description": "Tropical Storm Warning in effect for central Bahamas including Exuma",
-                                                "severity": "Moderate",
-                                                "urgency": "Immediate",
-                                                "source": "NHC",
-                                                "storm": storm_name
-                                            })
-                                            break  # Only add once
-                                else:
-                                    # Other Bahamas areas - use general detection
-                                    if "tropical storm watch" in adv_text and "bahamas" in adv_text:
-                                        alerts.append({
-                                            "event": "Tropical Storm Watch",
-                                            "description": "Tropical Storm Watch in effect for portions of the Bahamas",
-                                            "severity": "Moderate",
-                                            "urgency": "Expected",
-                                            "source": "NHC",
-                                            "storm": storm_name
-                                        })
-
-                                    if "tropical storm warning" in adv_text and "bahamas" in adv_text:
-                                        alerts.append({
-                                            "event": "Tropical Storm Warning",
-                                            "description": "Tropical Storm Warning in effect for portions of the Bahamas",
-                                            "severity": "Moderate",
-                                            "urgency": "Immediate",
-                                            "source": "NHC",
-                                            "storm": storm_name
-                                        })
-
-                                if "hurricane watch" in adv_text and ("bahamas" in adv_text or "nassau" in adv_text):
-                                    alerts.append({
-                                        "event": "Hurricane Watch",
-                                        "description": "Hurricane Watch in effect for portions of the Bahamas",
-                                        "severity": "Severe",
-                                        "urgency": "Expected",
-                                        "source": "NHC",
-                                        "storm": storm_name
-                                    })
-
-                                if "hurricane warning" in adv_text and ("bahamas" in adv_text or "nassau" in adv_text):
-                                    alerts.append({
-                                        "event": "Hurricane Warning",
-                                        "description": "Hurricane Warning in effect for portions of the Bahamas",
-                                        "severity": "Extreme",
-                                        "urgency": "Immediate",
-                                        "source": "NHC",
-                                        "storm": storm_name
-                                    })
+                        adv_text = adv_future.result()
+                        if adv_text is not None:
+                            add_alerts(self._get_advisory_alerts(advisory_url, adv_text, region))
 
                     except Exception as e:
-                        self.logger.debug(f"Could not check advisory {advisory_url}: {e}")
+                        self.logger.debug("Could not check advisory %s: %s", advisory_url, e)
 
             except Exception as e:
-                self.logger.debug(f"Could not check storm advisories: {e}")
+                self.logger.debug("Could not check storm advisories: %s", e)
 
         except Exception as e:
-            self.logger.warning(f"NHC alert check failed: {e}")
+            self.logger.warning("NHC alert check failed: %s", e)
 
         return alerts
 
+    def _get_advisory_alerts(
+        self,
+        advisory_url: str,
+        adv_text: str,
+        region: _BahamasRegion | None,
+    ) -> list[dict]:
+        """Get Bahamas watches/warnings from a storm advisory.
+
+        Parsed alerts are cached per advisory and region for as long as the
+        advisory text itself is unchanged.
+
+        Args:
+            advisory_url: Storm advisory URL
+            adv_text: Lowercased advisory text
+            region: Bahamas region the location is in, or None
+
+        Returns:
+            List of NHC alerts in NWS-compatible format
+        """
+        cache_key = (advisory_url, region.area if region else None)
+        cached = _advisory_alerts_cache.get(cache_key)
+        # The text cache hands out the same string until it refetches
+        if cached is not None and cached[0] is adv_text:
+            return list(cached[1])
+
+        advisory_alerts = self._parse_advisory_alerts(advisory_url, adv_text, region)
+        _advisory_alerts_cache.set(cache_key, (adv_text, advisory_alerts))
+        return list(advisory_alerts)
+
+    def _parse_advisory_alerts(
+        self,
+        advisory_url: str,
+        adv_text: str,
+        region: _BahamasRegion | None,
+    ) -> list[dict]:
+        """Parse Bahamas watches/warnings from lowercased storm advisory text.
+
+        Args:
+            advisory_url: Storm advisory URL
+            adv_text: Lowercased advisory text
+            region: Bahamas region the location is in, or None
+
+        Returns:
+            List of NHC alerts in NWS-compatible format
+        """
+        advisory_alerts = []
+
+        # Check if this advisory mentions Bahamas
+        has_bahamas = "bahamas" in adv_text
+        if not (has_bahamas or "nassau" in adv_text):
+            return advisory_alerts
+
+        self.logger.debug("Found Bahamas mention in %s", advisory_url)
+
+        # Extract storm name from the advisory
+        storm_name = "Unknown Storm"
+        for pattern in _NAME_PATTERNS:
+            match = pattern.search(adv_text)
+            if match:
+                storm_name = match.group(1).title()
+                break
+
+        # Parse watches and warnings more precisely
+        # Check if this location is specifically mentioned in watch/warning areas
+        if region is not None:
+            # Only alerts for this part of the Bahamas apply
+            section = _find_section_mention(adv_text, region.locations)
+            if section == "watch":
+                advisory_alerts.append({
+                    "event": "Tropical Storm Watch",
+                    "description": f"Tropical Storm Watch in effect for {region.area}",
+                    "severity": "Moderate",
+                    "urgency": "Expected",
+                    "source": "NHC",
+                    "storm": storm_name
+                })
+            elif section == "warning":
+                advisory_alerts.append({
+                    "event": "Tropical Storm Warning",
+                    "description": f"Tropical Storm Warning in effect for {region.area}",
+                    "severity": "Moderate",
+                    "urgency": "Immediate",
+                    "source": "NHC",
+                    "storm": storm_name
+                })
+        else:
+            # Other Bahamas areas - use general detection
+            if has_bahamas and "tropical storm watch" in adv_text:
+                advisory_alerts.append({
+                    "event": "Tropical Storm Watch",
+                    "description": "Tropical Storm Watch in effect for portions of the Bahamas",
+                    "severity": "Moderate",
+                    "urgency": "Expected",
+                    "source": "NHC",
+                    "storm": storm_name
+                })
+
+            if has_bahamas and "tropical storm warning" in adv_text:
+                advisory_alerts.append({
+                    "event": "Tropical Storm Warning",
+                    "description": "Tropical Storm Warning in effect for portions of the Bahamas",
+                    "severity": "Moderate",
+                    "urgency": "Immediate",
+                    "source": "NHC",
+                    "storm": storm_name
+                })
+
+        # The mention check above already found "bahamas" or "nassau"
+        if "hurricane watch" in adv_text:
+            advisory_alerts.append({
+                "event": "Hurricane Watch",
+                "description": "Hurricane Watch in effect for portions of the Bahamas",
+                "severity": "Severe",
+                "urgency": "Expected",
+                "source": "NHC",
+                "storm": storm_name
+            })
+
+        if "hurricane warning" in adv_text:
+            advisory_alerts.append({
+                "event": "Hurricane Warning",
+                "description": "Hurricane Warning in effect for portions of the Bahamas",
+                "severity": "Extreme",
+                "urgency": "Immediate",
+                "source": "NHC",
+                "storm": storm_name
+            })
+
+        return advisory_alerts
+
+    def _get_advisory_text(self, advisory_url: str, headers: dict[str, str]) -> str | None:
+        """Get the lowercased text of an NHC storm advisory.
+
+        Advisories change every few hours at most, so successful responses
+        are lowercased once and kept in a process-local TTL cache. The text
+        and its validators are also persisted in the API cache so that later
+        runs can revalidate with a conditional GET and skip the download on 304.
+
+        Args:
+            advisory_url: Storm advisory URL
+            headers: Request headers
+
+        Returns:
+            Lowercased advisory text, or None if the advisory is unavailable
+        """
+        cached_text = _advisory_text_cache.get(advisory_url)
+        if cached_text is not None:
+            return cached_text
+
+        cache_key = "advisory_" + hashlib.md5(advisory_url.encode(), usedforsecurity=False).hexdigest()
+        stored = api_cache.get(cache_key) or {}
+
+        request_headers = dict(headers)
+        if stored.get("etag"):
+            request_headers["If-None-Match"] = stored["etag"]
+        if stored.get("last_modified"):
+            request_headers["If-Modified-Since"] = stored["last_modified"]
+
+        response = self.session.get(advisory_url, headers=request_headers, timeout=10)
+
+        if response.status_code == 304 and "text" in stored:
+            self.logger.debug("NHC advisory %s not modified, reusing cached text", advisory_url)
+            adv_text = stored["text"]
+        elif response.status_code == 200:
+            adv_text = response.text.lower()
+            api_cache.set(cache_key, {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "text": adv_text,
+            })
+        else:
+            return None
+
+        _advisory_text_cache.set(advisory_url, adv_text)
+        return adv_text
+
+    def _get_outlook_alerts(self, outlook_url: str, headers: dict[str, str]) -> list[dict]:
+        """Get Bahamas watches/warnings from the tropical weather outlook.
+
+        Parsed alerts are kept in a process-local TTL cache. The response
+        validators are persisted in the API cache so that later runs can
+        revalidate with a conditional GET and reuse the parse on 304.
+
+        Args:
+            outlook_url: Tropical weather outlook URL
+            headers: Request headers
+
+        Returns:
+            List of NHC alerts in NWS-compatible format
+        """
+        cached_alerts = _outlook_alerts_cache.get(outlook_url)
+        if cached_alerts is not None:
+            return list(cached_alerts)
+
+        cache_key = "outlook_" + hashlib.md5(outlook_url.encode(), usedforsecurity=False).hexdigest()
+        stored = api_cache.get(cache_key) or {}
+
+        request_headers = dict(headers)
+        if stored.get("etag"):
+            request_headers["If-None-Match"] = stored["etag"]
+        if stored.get("last_modified"):
+            request_headers["If-Modified-Since"] = stored["last_modified"]
+
+        response = self.session.get(outlook_url, headers=request_headers, timeout=15)
+
+        if response.status_code == 304 and "alerts" in stored:
+            self.logger.debug("NHC outlook not modified, reusing cached alerts")
+            outlook_alerts = stored["alerts"]
+        elif response.status_code == 200:
+            outlook_alerts = self._parse_outlook_alerts(response.text.lower())
+            api_cache.set(cache_key, {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "alerts": outlook_alerts,
+            })
+        else:
+            return []
+
+        _outlook_alerts_cache.set(outlook_url, outlook_alerts)
+        return list(outlook_alerts)
+
+    @staticmethod
+    def _parse_outlook_alerts(text: str) -> list[dict]:
+        """Parse Bahamas watches/warnings from lowercased outlook text.
+
+        Args:
+            text: Lowercased tropical weather outlook text
+
+        Returns:
+            List of NHC alerts in NWS-compatible format
+        """
+        outlook_alerts = []
+
+        # Look for Bahamas mentions with watches/warnings
+        if "bahamas" in text or "nassau" in text:
+            if "tropical storm watch" in text:
+                outlook_alerts.append({
+                    "event": "Tropical Storm Watch",
+                    "description": "Tropical Storm Watch in effect for portions of the Bahamas",
+                    "severity": "Moderate",
+                    "urgency": "Expected",
+                    "source": "NHC"
+                })
+            if "tropical storm warning" in text:
+                outlook_alerts.append({
+                    "event": "Tropical Storm Warning",
+                    "description": "Tropical Storm Warning in effect for portions of the Bahamas",
+                    "severity": "Moderate",
+                    "urgency": "Immediate",
+                    "source": "NHC"
+                })
+            if "hurricane watch" in text:
+                outlook_alerts.append({
+                    "event": "Hurricane Watch",
+                    "description": "Hurricane Watch in effect for portions of the Bahamas",
+                    "severity": "Severe",
+                    "urgency": "Expected",
+                    "source": "NHC"
+                })
+            if "hurricane warning" in text:
+                outlook_alerts.append({
+                    "event": "Hurricane Warning",
+                    "description": "Hurricane Warning in effect for portions of the Bahamas",
+                    "severity": "Extreme",
+                    "urgency": "Immediate",
+                    "source": "NHC"
+                })
+
+        return outlook_alerts
+
     def _apply_nws_overrides(
         self,
         current_level: AlertLevel,
-        nws_alerts: list[dict]
+        alert_text: list[tuple[str, str, str]],
     ) -> AlertLevel:
         """Apply NWS alert overrides to threat level.
 
         Args:
             current_level: Current alert level
-            nws_alerts: NWS alerts
+            alert_text: NWS alerts as (event lower, description lower, event) tuples
 
         Returns:
             Potentially upgraded alert level
         """
         highest_nws_level = AlertLevel.ALL_CLEAR
 
-        for alert in nws_alerts:
-            # Handle both NWSAlert objects and dict objects
-            if hasattr(alert, 'event'):
-                # NWSAlert object
-                event = alert.event.lower()
-            else:
-                # Dict object
-                event = alert.get("event", "").lower()
-
-            if "hurricane warning" in event:
-                nws_level = AlertLevel.HURRICANE_WARNING
-            elif "hurricane watch" in event or "tropical storm warning" in event:
-                nws_level = AlertLevel.TROPICAL_STORM_WARNING_HURRICANE_WATCH_EVACUATION
-            elif "tropical storm watch" in event:
-                nws_level = AlertLevel.TROPICAL_STORM_WATCH_HURRICANE_THREAT
-            else:
+        for event, _, _ in alert_text:
+            nws_level = _event_level(event)
+            if nws_level is None:
                 continue
 
             if nws_level.value > highest_nws_level.value:
                 highest_nws_level = nws_level
+                # Nothing outranks a hurricane warning
+                if highest_nws_level is AlertLevel.HURRICANE_WARNING:
+                    break
 
         # Return the higher of current level or NWS level
         return (highest_nws_level if highest_nws_level.value > current_level.value
@@ -112,6 +112,30 @@ class CurrentStormsClient:
             logger.error(f"Failed to fetch current storms: {e}")
             return []
 
+    def fetch_atlantic_bins(self) -> list[str] | None:
+        """Fetch the advisory bin numbers of active Atlantic storms.
+
+        The feed is requested directly rather than through the 6 hour API
+        cache, so a storm that becomes active in a new bin is seen right away.
+
+        Returns:
+            Bin numbers such as "AT4", or None if CurrentStorms.json is unavailable
+        """
+        try:
+            response = self.session.get(CURRENT_STORMS_JSON, timeout=self.timeout)
+            response.raise_for_status()
+            storms_data = response.json()
+        except Exception as e:
+            logger.warning(f"Failed to fetch active storm bins: {e}")
+            return None
+
+        bins = []
+        for storm in storms_data.get("activeStorms", []):
+            bin_number = str(storm.get("binNumber") or "").upper()
+            if bin_number.startswith("AT"):
+                bins.append(bin_number)
+        return bins
+
     def _parse_storm_data(self, storm: dict) -> NHCCone | None:
         """Parse storm data from CurrentStorms.json.
 
@@ -296,3 +320,13 @@ def get_current_storms_with_positions() -> list[NHCCone]:
     """
     client = CurrentStormsClient()
     return client.fetch_current_storms()
+
+
+def get_active_atlantic_bins() -> list[str] | None:
+    """Get the advisory bin numbers (AT1-AT5) of active Atlantic storms.
+
+    Returns:
+        Bin numbers, or None if CurrentStorms.json is unavailable
+    """
+    client = CurrentStormsClient()
+    return client.fetch_atlantic_bins()
@@ -6,7 +6,9 @@ import tempfile
 import time
 from pathlib import Path
 
-from weatherbot.cache import APICache
+import pytest
+
+from weatherbot.cache import APICache, TTLCache, ttl_cache
 
 
 class TestAPICache:
@@ -315,3 +317,71 @@ class TestAPICache:
             # Memory cache should not grow unbounded
             # (Implementation may have size limits)
             assert len(cache._memory_cache) <= 1000
+
+
+class TestTTLCache:
+    """Test TTLCache class and ttl_cache decorator."""
+
+    def test_set_and_get(self) -> None:
+        """Test setting and getting values."""
+        cache = TTLCache(ttl_seconds=60)
+        cache.set("key", [1, 2, 3])
+
+        assert cache.get("key") == [1, 2, 3]
+        assert cache.get("missing") is None
+        assert cache.get("missing", "default") == "default"
+
+    def test_expiry(self) -> None:
+        """Test that entries expire after the TTL."""
+        cache = TTLCache(ttl_seconds=0.01)
+        cache.set("key", "value")
+        time.sleep(0.02)
+
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self) -> None:
+        """Test that the least recently used entry is evicted."""
+        cache = TTLCache(ttl_seconds=60, maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_ttl_cache_decorator(self) -> None:
+        """Test that decorated functions are memoized per argument set."""
+        calls = []
+
+        @ttl_cache(seconds=60)
+        def fetch(value: int) -> int:
+            calls.append(value)
+            return value * 2
+
+        assert fetch(1) == 2
+        assert fetch(1) == 2
+        assert fetch(2) == 4
+        assert calls == [1, 2]
+
+        fetch.cache_clear()
+        assert fetch(1) == 2
+        assert calls == [1, 2, 1]
+
+    def test_ttl_cache_does_not_cache_exceptions(self) -> None:
+        """Test that exceptions propagate and are retried."""
+        calls = []
+
+        @ttl_cache(seconds=60)
+        def flaky() -> str:
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("boom")
+            return "ok"
+
+        with pytest.raises(RuntimeError):
+            flaky()
+        assert flaky() == "ok"
+        assert len(calls) == 2
@@ -0,0 +1,780 @@
+# tests/test_enhanced_cone_analyzer.py
+"""Tests for the enhanced cone analyzer."""
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock, PropertyMock, patch
+
+import pytest
+from shapely.geometry import Point, Polygon
+from shapely.prepared import prep
+
+from weatherbot import enhanced_cone_analyzer
+from weatherbot.alert_levels import AlertLevel
+from weatherbot.enhanced_cone_analyzer import (
+    EnhancedConeAnalyzer,
+    StormCategory,
+    _haversine_km,
+    _normalize_alerts,
+    _prepare_cone,
+)
+from weatherbot.nhc import NHCCone
+from weatherbot.nws import NWSAlert
+
+
+def _square_cone(
+    storm_id: str = "AL012025",
+    storm_name: str = "Test",
+    storm_type: str = "Hurricane",
+    size: float = 2.0,
+) -> NHCCone:
+    """Build a square cone centred on (25N, 80W)."""
+    half = size / 2
+    geometry = Polygon([
+        (-80 - half, 25 - half),
+        (-80 + half, 25 - half),
+        (-80 + half, 25 + half),
+        (-80 - half, 25 + half),
+    ])
+    return NHCCone(
+        geometry=geometry,
+        storm_id=storm_id,
+        storm_name=storm_name,
+        storm_type=storm_type,
+        current_position=(25.0, -80.0),
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_upstream_caches():
+    """Reset process-local fetch caches between tests."""
+    for fetch in (
+        enhanced_cone_analyzer._cached_storm_cones,
+        enhanced_cone_analyzer._cached_current_storms,
+        enhanced_cone_analyzer._cached_atcf_positions,
+        enhanced_cone_analyzer._cached_active_cones,
+        enhanced_cone_analyzer._cached_hurricane_alerts,
+        enhanced_cone_analyzer._cached_atlantic_bins,
+    ):
+        fetch.cache_clear()
+    enhanced_cone_analyzer._outlook_alerts_cache.clear()
+    enhanced_cone_analyzer._advisory_text_cache.clear()
+    enhanced_cone_analyzer._advisory_alerts_cache.clear()
+    enhanced_cone_analyzer._analysis_cache.clear()
+    enhanced_cone_analyzer._load_county_polygon_cached.cache_clear()
+    yield
+
+
+@pytest.fixture
+def storm_sources():
+    """Patch the upstream storm sources; each returns no storms by default."""
+    with patch(
+        "weatherbot.enhanced_cone_analyzer.get_all_active_storm_cones", return_value=[]
+    ) as storm_cones, patch(
+        "weatherbot.enhanced_cone_analyzer.get_current_storms_with_positions", return_value=[]
+    ) as current, patch(
+        "weatherbot.enhanced_cone_analyzer.get_atcf_invest_positions", return_value={}
+    ) as atcf, patch(
+        "weatherbot.enhanced_cone_analyzer.get_active_cones", return_value=([], [])
+    ) as active:
+        yield SimpleNamespace(
+            storm_cones=storm_cones, current=current, atcf=atcf, active=active
+        )
+
+
+class TestEnhancedStormData:
+    """Test storm data collection."""
+
+    def test_cones_are_prepared(self, storm_sources) -> None:
+        """Test that collected cones carry prepared geometries."""
+        cone = _square_cone()
+        storm_sources.storm_cones.return_value = [cone]
+
+        cones, geometries = EnhancedConeAnalyzer()._get_enhanced_storm_data()
+
+        assert cones == [cone]
+        assert geometries == [cone.geometry]
+        assert cone._prepared is not None
+        assert cone._bbox == cone.geometry.bounds
+
+    def test_upstream_fetches_are_cached(self, storm_sources) -> None:
+        """Test that back-to-back collections reuse cached fetches."""
+        storm_sources.storm_cones.return_value = [_square_cone()]
+
+        analyzer = EnhancedConeAnalyzer()
+        analyzer._get_enhanced_storm_data()
+        analyzer._get_enhanced_storm_data()
+
+        assert storm_sources.storm_cones.call_count == 1
+        assert storm_sources.current.call_count == 1
+        assert storm_sources.atcf.call_count == 1
+        assert storm_sources.active.call_count == 1
+
+    def test_source_failure_keeps_other_sources(self, storm_sources) -> None:
+        """Test that one failing source does not drop the others."""
+        primary = _square_cone(storm_id="AL012025")
+        duplicate = _square_cone(storm_id="AL012025")
+        fallback = _square_cone(storm_id="AL022025")
+        storm_sources.storm_cones.return_value = [primary]
+        storm_sources.current.side_effect = RuntimeError("down")
+        storm_sources.active.return_value = ([duplicate, fallback], [])
+
+        cones, _ = EnhancedConeAnalyzer()._get_enhanced_storm_data()
+
+        assert cones == [primary, fallback]
+
+
+class TestAtcfEnhancement:
+    """Test merging ATCF invest positions."""
+
+    def test_id_match_preferred_over_earlier_name_match(self) -> None:
+        """Test that an exact id match wins over an earlier name match."""
+        analyzer = EnhancedConeAnalyzer()
+        by_name = _square_cone(storm_id="AL012025", storm_name="Remnants of AL93")
+        by_id = _square_cone(storm_id="AL93", storm_name="Invest")
+        cones = [by_name, by_id]
+
+        result = analyzer._enhance_with_atcf_data(cones, {"AL93": (20.0, -60.0)})
+
+        assert result is cones
+        assert by_id.current_position == (20.0, -60.0)
+        assert by_name.current_position == (25.0, -80.0)
+
+    def test_name_match_and_new_invest(self) -> None:
+        """Test name matching and creation of cones for unknown invests."""
+        analyzer = EnhancedConeAnalyzer()
+        named = _square_cone(storm_id="AL012025", storm_name="Invest AL94")
+        cones = [named]
+
+        analyzer._enhance_with_atcf_data(
+            cones, {"AL94": (18.0, -50.0), "AL95": (15.0, -40.0)}
+        )
+
+        assert named.current_position == (18.0, -50.0)
+        assert len(cones) == 2
+        assert cones[1].storm_id == "AL95"
+        assert cones[1].current_position == (15.0, -40.0)
+        assert len(cones[1].geometry.exterior.coords) == 33
+        assert cones[1].geometry.contains(Point(-40.0, 16.9))
+
+
+class TestPreciseIntersection:
+    """Test point and county intersection checks."""
+
+    def test_prepared_point_inside(self) -> None:
+        """Test prepared point-in-polygon for a point inside the cone."""
+        analyzer = EnhancedConeAnalyzer()
+        cone = _square_cone()
+        _prepare_cone(cone)
+
+        assert analyzer._check_precise_intersection(
+            cone.geometry, 25.0, -80.0, None, cone
+        ) is True
+
+    def test_prebuilt_query_point_used(self) -> None:
+        """Test that a prebuilt query point is tested instead of the coordinates."""
+        analyzer = EnhancedConeAnalyzer()
+        cone = _square_cone()
+        _prepare_cone(cone)
+
+        # The coordinates only pass the bbox reject; the point decides
+        assert analyzer._check_precise_intersection(
+            cone.geometry, 25.0, -80.0, None, cone, query_point=Point(-80.0, 25.0)
+        ) is True
+        assert analyzer._check_precise_intersection(
+            cone.geometry, 25.0, -80.0, None, cone, query_point=Point(-70.0, 25.0)
+        ) is False
+
+    def test_prepared_point_outside_bbox(self) -> None:
+        """Test that points outside the bounding box are rejected."""
+        analyzer = EnhancedConeAnalyzer()
+        cone = _square_cone()
+        _prepare_cone(cone)
+
+        with patch("weatherbot.enhanced_cone_analyzer.point_in_any") as mock_pip:
+            assert analyzer._check_precise_intersection(
+                cone.geometry, 40.0, -60.0, None, cone
+            ) is False
+            mock_pip.assert_not_called()
+
+    def test_bbox_reject_skips_area_computation(self) -> None:
+        """Test that the bbox reject runs before the size gate."""
+        analyzer = EnhancedConeAnalyzer()
+        cone = _square_cone(size=10.0)
+        _prepare_cone(cone)
+        geometry = Mock()
+        area = PropertyMock(return_value=100.0)
+        type(geometry).area = area
+
+        assert analyzer._check_precise_intersection(
+            geometry, 40.0, -60.0, None, cone
+        ) is False
+        area.assert_not_called()
+
+    def test_county_bbox_reject(self) -> None:
+        """Test that counties outside the cone bbox are rejected."""
+        analyzer = EnhancedConeAnalyzer()
+        cone = _square_cone()
+        _prepare_cone(cone)
+        near = prep(Polygon([(-79.5, 25.5), (-78.0, 25.5), (-78.0, 27.0), (-79.5, 27.0)]))
+        far = prep(Polygon([(-60, 40), (-59, 40), (-59, 41), (-60, 41)]))
+
+        assert analyzer._check_precise_intersection(cone.geometry, 0.0, 0.0, near, cone) is True
+        assert analyzer._check_precise_intersection(cone.geometry, 0.0, 0.0, far, cone) is False
+
+    def test_prepared_point_on_boundary(self) -> None:
+        """Test that boundary points count as inside."""
+        analyzer = EnhancedConeAnalyzer()
+        cone = _square_cone()
+        _prepare_cone(cone)
+
+        assert analyzer._check_precise_intersection(
+            cone.geometry, 25.0, -79.0, None, cone
+        ) is True
+
+    def test_unprepared_cone_falls_back(self) -> None:
+        """Test that cones without prepared geometry still work."""
+        analyzer = EnhancedConeAnalyzer()
+        cone = _square_cone()
+
+        assert analyzer._check_precise_intersection(
+            cone.geometry, 25.0, -80.0, None, cone
+        ) is True
+        assert analyzer._check_precise_intersection(
+            cone.geometry, 30.0, -80.0, None, cone
+        ) is False
+
+    def test_index_prunes_distant_cones(self, storm_sources) -> None:
+        """Test that the cone index only returns cones near the query point."""
+        near = _square_cone(storm_id="AL012025")
+        far = _square_cone(storm_id="AL022025")
+        far.geometry = Polygon([(-40, 10), (-38, 10), (-38, 12), (-40, 12)])
+        storm_sources.storm_cones.return_value = [near, far]
+
+        analyzer = EnhancedConeAnalyzer()
+        analyzer._get_enhanced_storm_data()
+        candidates = analyzer._query_candidate_cones(Point(-80.0, 25.0))
+
+        assert candidates == {id(near)}
+        assert analyzer._check_precise_intersection(
+            far.geometry, 11.0, -39.0, None, far, candidates=candidates
+        ) is False
+
+    def test_no_index_means_no_pruning(self) -> None:
+        """Test that queries without an index do not prune."""
+        assert EnhancedConeAnalyzer()._query_candidate_cones(Point(-80.0, 25.0)) is None
+
+    def test_large_development_area_skipped(self) -> None:
+        """Test that large unnamed development areas are not treated as cones."""
+        analyzer = EnhancedConeAnalyzer()
+        cone = _square_cone(storm_id="", storm_name="", storm_type="Development Area", size=10.0)
+        _prepare_cone(cone)
+
+        assert cone._bbox_area == 100.0
+        assert analyzer._check_precise_intersection(
+            cone.geometry, 25.0, -80.0, None, cone
+        ) is False
+
+    def test_large_named_storm_checked(self) -> None:
+        """Test that large named storm cones are still checked."""
+        analyzer = EnhancedConeAnalyzer()
+        cone = _square_cone(size=10.0)
+        _prepare_cone(cone)
+
+        assert analyzer._check_precise_intersection(
+            cone.geometry, 25.0, -80.0, None, cone
+        ) is True
+
+
+class TestDistanceFilter:
+    """Test distance-based storm filtering."""
+
+    def test_filter_keeps_order_and_caches_distance(self) -> None:
+        """Test that nearby storms are kept in order with cached distances."""
+        analyzer = EnhancedConeAnalyzer()
+        near = _square_cone(storm_id="AL012025")
+        far = _square_cone(storm_id="AL022025")
+        far.current_position = (45.0, -20.0)
+        unpositioned = _square_cone(storm_id="AL032025")
+        unpositioned.current_position = None
+
+        result = analyzer._filter_storms_by_distance(
+            [near, far, unpositioned], (25.5, -80.0), 2000.0
+        )
+
+        assert result == [near, unpositioned]
+        expected = _haversine_km(25.5, -80.0, 25.0, -80.0)
+        key, distance = near._distance_cache
+        assert key == (25.5, -80.0, near.current_position)
+        assert abs(distance - expected) < 1e-6
+        assert analyzer._calculate_distance(near, 25.5, -80.0) == distance
+
+    def test_prefilter_matches_haversine_at_the_radius(self) -> None:
+        """Test that the prefilter keeps exactly the storms haversine keeps."""
+        analyzer = EnhancedConeAnalyzer()
+        cones = []
+        for lat in range(-10, 71, 5):
+            for lon in range(-120, -39, 5):
+                cone = _square_cone(storm_id=f"{lat}/{lon}")
+                cone.current_position = (float(lat), float(lon))
+                cones.append(cone)
+
+        for target in ((25.0, -80.0), (45.0, -60.0), (60.0, -100.0)):
+            result = analyzer._filter_storms_by_distance(cones, target, 2000.0)
+            expected = [
+                cone for cone in cones
+                if _haversine_km(*target, *cone.current_position) <= 2000.0
+            ]
+            assert result == expected
+
+    def test_prefilter_wraps_dateline(self) -> None:
+        """Test that storms across the antimeridian are measured correctly."""
+        analyzer = EnhancedConeAnalyzer()
+        cone = _square_cone()
+        cone.current_position = (20.0, 179.5)
+
+        assert analyzer._filter_storms_by_distance([cone], (20.0, -179.5), 500.0) == [cone]
+
+    def test_calculate_distance_ignores_stale_cache(self) -> None:
+        """Test that cached distances are only reused for the same origin."""
+        analyzer = EnhancedConeAnalyzer()
+        cone = _square_cone()
+        analyzer._filter_storms_by_distance([cone], (25.5, -80.0), 2000.0)
+
+        distance = analyzer._calculate_distance(cone, 30.0, -80.0)
+
+        assert abs(distance - _haversine_km(30.0, -80.0, 25.0, -80.0)) < 1e-6
+
+
+class TestArrivalEstimate:
+    """Test arrival time estimation."""
+
+    def test_speed_units(self) -> None:
+        """Test that movement speeds are converted per unit."""
+        analyzer = EnhancedConeAnalyzer()
+        cone = _square_cone()
+        cone.current_position = (25.0, -75.0)
+        distance = analyzer._calculate_distance(cone, 25.0, -80.0)
+
+        cone.movement = "W at 10 MPH"
+        assert analyzer._estimate_arrival_time(cone, 25.0, -80.0) == int(distance / 16.09)
+
+        cone.movement = "W at 10 knots"
+        assert analyzer._estimate_arrival_time(cone, 25.0, -80.0) == int(distance / 18.52)
+
+        cone.movement = "W at 20 km/h"
+        assert analyzer._estimate_arrival_time(cone, 25.0, -80.0) == int(distance / 20)
+
+    def test_default_speed(self) -> None:
+        """Test the default speed when movement has no parsable speed."""
+        analyzer = EnhancedConeAnalyzer()
+        cone = _square_cone()
+        cone.current_position = (25.0, -75.0)
+        cone.movement = "Stationary"
+        distance = analyzer._calculate_distance(cone, 25.0, -80.0)
+
+        assert analyzer._estimate_arrival_time(cone, 25.0, -80.0) == int(distance / 15)
+
+
+class TestCategorizeStorm:
+    """Test storm categorization."""
+
+    def test_type_keywords(self) -> None:
+        """Test categorization from storm type alone."""
+        analyzer = EnhancedConeAnalyzer()
+
+        assert analyzer._categorize_storm(_square_cone(storm_type="Hurricane")) == StormCategory.HURRICANE_MINOR
+        assert analyzer._categorize_storm(_square_cone(storm_type="Tropical Storm")) == StormCategory.TROPICAL_STORM
+        assert analyzer._categorize_storm(_square_cone(storm_type="Tropical Depression")) == StormCategory.TROPICAL_DEPRESSION
+        assert analyzer._categorize_storm(_square_cone(storm_type="Tropical Disturbance")) == StormCategory.INVEST_DISTURBANCE
+
+    def test_winds_outrank_weaker_type(self) -> None:
+        """Test that stronger winds override a weaker storm type."""
+        analyzer = EnhancedConeAnalyzer()
+        cone = _square_cone(storm_type="Tropical Storm")
+        cone.max_winds = "80"
+        assert analyzer._categorize_storm(cone) == StormCategory.HURRICANE_MINOR
+
+        cone = _square_cone(storm_type="Hurricane")
+        cone.max_winds = 120
+        assert analyzer._categorize_storm(cone) == StormCategory.HURRICANE_MAJOR
+
+    def test_type_outranks_weaker_winds(self) -> None:
+        """Test that a stronger storm type overrides weaker winds."""
+        analyzer = EnhancedConeAnalyzer()
+        cone = _square_cone(storm_type="Hurricane")
+        cone.max_winds = 30
+        assert analyzer._categorize_storm(cone) == StormCategory.HURRICANE_MINOR
+
+    def test_name_fallbacks(self) -> None:
+        """Test invest and development area detection from the name."""
+        analyzer = EnhancedConeAnalyzer()
+
+        assert analyzer._categorize_storm(
+            _square_cone(storm_id="", storm_name="Invest", storm_type="Unknown")
+        ) == StormCategory.INVEST_DISTURBANCE
+        assert analyzer._categorize_storm(
+            _square_cone(storm_id="", storm_name="Area 1", storm_type="Unknown")
+        ) == StormCategory.DEVELOPMENT_AREA
+        assert analyzer._categorize_storm(
+            _square_cone(storm_id="", storm_name="", storm_type="Unknown")
+        ) == StormCategory.UNKNOWN
+
+    def test_invest_detected_from_atcf_id(self) -> None:
+        """Test that only ATCF invest numbers mark a system as an invest."""
+        analyzer = EnhancedConeAnalyzer()
+
+        for storm_id in ("AL93", "ep952025", "CP90"):
+            assert analyzer._categorize_storm(
+                _square_cone(storm_id=storm_id, storm_name="", storm_type="Unknown")
+            ) == StormCategory.INVEST_DISTURBANCE
+
+        # Numbered storms that merely contain a 9 are not invests
+        for storm_id in ("AL092025", "AL192019", "EP09"):
+            assert analyzer._categorize_storm(
+                _square_cone(storm_id=storm_id, storm_name="", storm_type="Unknown")
+            ) == StormCategory.UNKNOWN
+
+
+class TestOutlookAlerts:
+    """Test tropical weather outlook fetching."""
+
+    OUTLOOK_URL = "https://example.com/outlook"
+
+    @patch("weatherbot.enhanced_cone_analyzer.api_cache")
+    @patch("weatherbot.enhanced_cone_analyzer.requests.Session.get")
+    def test_outlook_parsed_and_validators_stored(self, mock_get, mock_api_cache) -> None:
+        """Test that a fresh outlook is parsed and its validators persisted."""
+        mock_api_cache.get.return_value = None
+        mock_get.return_value = Mock(
+            status_code=200,
+            text="Tropical Storm Watch for the Northwestern Bahamas",
+            headers={"ETag": '"abc"', "Last-Modified": "Mon, 01 Sep 2025 00:00:00 GMT"},
+        )
+
+        alerts = EnhancedConeAnalyzer()._get_outlook_alerts(self.OUTLOOK_URL, {})
+
+        assert [alert["event"] for alert in alerts] == ["Tropical Storm Watch"]
+        stored = mock_api_cache.set.call_args[0][1]
+        assert stored["etag"] == '"abc"'
+        assert stored["alerts"] == alerts
+
+    @patch("weatherbot.enhanced_cone_analyzer.api_cache")
+    @patch("weatherbot.enhanced_cone_analyzer.requests.Session.get")
+    def test_outlook_not_modified_reuses_alerts(self, mock_get, mock_api_cache) -> None:
+        """Test conditional GET and reuse of the stored parse on 304."""
+        stored_alerts = [{"event": "Hurricane Warning", "source": "NHC"}]
+        mock_api_cache.get.return_value = {
+            "etag": '"abc"',
+            "last_modified": "Mon, 01 Sep 2025 00:00:00 GMT",
+            "alerts": stored_alerts,
+        }
+        mock_get.return_value = Mock(status_code=304, text="", headers={})
+
+        analyzer = EnhancedConeAnalyzer()
+        alerts = analyzer._get_outlook_alerts(self.OUTLOOK_URL, {"User-Agent": "test"})
+
+        assert alerts == stored_alerts
+        sent_headers = mock_get.call_args[1]["headers"]
+        assert sent_headers["If-None-Match"] == '"abc"'
+        assert sent_headers["If-Modified-Since"] == "Mon, 01 Sep 2025 00:00:00 GMT"
+
+        # Second call within the TTL does not hit the network
+        analyzer._get_outlook_alerts(self.OUTLOOK_URL, {"User-Agent": "test"})
+        assert mock_get.call_count == 1
+
+
+SAMPLE_ADVISORY = """
+BULLETIN
+Tropical Storm Humberto Advisory Number 5
+
+SUMMARY OF WATCHES AND WARNINGS IN EFFECT:
+
+A Tropical Storm Warning is in effect for...
+* Central Bahamas including Exuma
+
+A Tropical Storm Watch is in effect for...
+* Northwestern Bahamas including New Providence
+
+A Tropical Storm Warning means that tropical storm conditions are expected.
+"""
+
+
+class TestAdvisoryAlerts:
+    """Test Bahamas watch/warning parsing from NHC storm advisories."""
+
+    @pytest.fixture(autouse=True)
+    def active_bins(self):
+        """Fall back to every advisory bin unless a test sets active bins."""
+        with patch(
+            "weatherbot.enhanced_cone_analyzer.get_active_atlantic_bins", return_value=None
+        ) as mock_bins:
+            yield mock_bins
+
+    @pytest.fixture(autouse=True)
+    def stored_advisories(self):
+        """Keep persisted advisory validators out of the shared API cache."""
+        with patch("weatherbot.enhanced_cone_analyzer.api_cache") as mock_api_cache:
+            mock_api_cache.get.return_value = None
+            yield mock_api_cache
+
+    @staticmethod
+    def _fake_get(url, **_kwargs):
+        if "MIATCPAT3" in url:
+            return Mock(status_code=200, text=SAMPLE_ADVISORY, headers={"ETag": '"adv5"'})
+        if "MIATCPAT1" in url:
+            raise ConnectionError("advisory unavailable")
+        return Mock(status_code=404, text="", headers={})
+
+    @patch.object(EnhancedConeAnalyzer, "_get_outlook_alerts", return_value=[])
+    @patch("weatherbot.enhanced_cone_analyzer.requests.Session.get")
+    def test_nassau_watch(self, mock_get, mock_outlook) -> None:
+        """Test that Nassau only picks up the northwestern Bahamas watch."""
+        mock_get.side_effect = self._fake_get
+
+        alerts = EnhancedConeAnalyzer()._get_nhc_alerts_for_location(25.06, -77.35)
+
+        assert mock_get.call_count == 5
+        assert [(alert["event"], alert["storm"]) for alert in alerts] == [
+            ("Tropical Storm Watch", "Humberto"),
+        ]
+        assert "New Providence" in alerts[0]["description"]
+
+    @patch.object(EnhancedConeAnalyzer, "_get_outlook_alerts", return_value=[])
+    @patch("weatherbot.enhanced_cone_analyzer.requests.Session.get")
+    def test_exuma_warning(self, mock_get, mock_outlook) -> None:
+        """Test that Exuma picks up the central Bahamas warning."""
+        mock_get.side_effect = self._fake_get
+
+        alerts = EnhancedConeAnalyzer()._get_nhc_alerts_for_location(23.5, -75.9)
+
+        assert [alert["event"] for alert in alerts] == ["Tropical Storm Warning"]
+        assert "Exuma" in alerts[0]["description"]
+
+    @patch.object(EnhancedConeAnalyzer, "_get_outlook_alerts", return_value=[])
+    @patch("weatherbot.enhanced_cone_analyzer.requests.Session.get")
+    def test_advisory_text_cached(self, mock_get, mock_outlook) -> None:
+        """Test that available advisories are not refetched within the TTL."""
+        mock_get.side_effect = self._fake_get
+
+        first = EnhancedConeAnalyzer()._get_nhc_alerts_for_location(25.06, -77.35)
+        second = EnhancedConeAnalyzer()._get_nhc_alerts_for_location(25.06, -77.35)
+
+        assert first == second
+        # Only the unavailable advisories are requested again
+        assert mock_get.call_count == 9
+
+    @patch.object(EnhancedConeAnalyzer, "_get_outlook_alerts", return_value=[])
+    @patch("weatherbot.enhanced_cone_analyzer.requests.Session.get")
+    def test_parsed_alerts_cached_per_region(self, mock_get, mock_outlook) -> None:
+        """Test that unchanged advisories are parsed once per region."""
+        mock_get.side_effect = self._fake_get
+        analyzer = EnhancedConeAnalyzer()
+
+        with patch.object(
+            analyzer, "_parse_advisory_alerts", wraps=analyzer._parse_advisory_alerts
+        ) as mock_parse:
+            nassau = analyzer._get_nhc_alerts_for_location(25.06, -77.35)
+            assert analyzer._get_nhc_alerts_for_location(25.06, -77.35) == nassau
+            assert mock_parse.call_count == 1
+
+            # A different region parses the same advisory again
+            exuma = analyzer._get_nhc_alerts_for_location(23.5, -75.9)
+            assert [alert["event"] for alert in exuma] == ["Tropical Storm Warning"]
+            assert mock_parse.call_count == 2
+
+    @patch.object(EnhancedConeAnalyzer, "_get_outlook_alerts", return_value=[])
+    @patch("weatherbot.enhanced_cone_analyzer.requests.Session.get")
+    def test_only_active_bins_fetched(self, mock_get, mock_outlook, active_bins) -> None:
+        """Test that only advisories for active storms are requested."""
+        mock_get.side_effect = self._fake_get
+        active_bins.return_value = ["AT3"]
+
+        alerts = EnhancedConeAnalyzer()._get_nhc_alerts_for_location(25.06, -77.35)
+
+        assert [alert["event"] for alert in alerts] == ["Tropical Storm Watch"]
+        assert [call.args[0] for call in mock_get.call_args_list] == [
+            "https://www.nhc.noaa.gov/text/refresh/MIATCPAT3+shtml/latest.shtml",
+        ]
+
+    @patch("weatherbot.enhanced_cone_analyzer.requests.Session.get")
+    def test_advisory_revalidated(self, mock_get, stored_advisories) -> None:
+        """Test that stored advisories are revalidated and reused on 304."""
+        url = "https://www.nhc.noaa.gov/text/refresh/MIATCPAT3+shtml/latest.shtml"
+        analyzer = EnhancedConeAnalyzer()
+
+        mock_get.side_effect = self._fake_get
+        text = analyzer._get_advisory_text(url, {})
+        stored = stored_advisories.set.call_args[0][1]
+        assert stored == {"etag": '"adv5"', "last_modified": None, "text": text}
+
+        enhanced_cone_analyzer._advisory_text_cache.clear()
+        stored_advisories.get.return_value = stored
+        mock_get.side_effect = None
+        mock_get.return_value = Mock(status_code=304, text="", headers={})
+
+        assert analyzer._get_advisory_text(url, {}) == text
+        assert mock_get.call_args[1]["headers"]["If-None-Match"] == '"adv5"'
+
+    def test_section_mentions(self) -> None:
+        """Test section tracking for header, reset and location lines."""
+        locations = enhanced_cone_analyzer._BAHAMAS_REGIONS[0].locations
+        find = enhanced_cone_analyzer._find_section_mention
+
+        assert find("a tropical storm watch is in effect for...\n* new providence", locations) == "watch"
+        # Locations on the header line itself are not mentions
+        assert find("a tropical storm warning is in effect for the northwestern bahamas", locations) is None
+        # A "means" line closes the section before the location
+        assert find(
+            "a tropical storm watch is in effect for...\n"
+            "a tropical storm watch means conditions are possible\n"
+            "* northwestern bahamas",
+            locations,
+        ) is None
+        assert find("northwestern bahamas", locations) is None
+
+    @patch.object(EnhancedConeAnalyzer, "_get_outlook_alerts", return_value=[])
+    @patch("weatherbot.enhanced_cone_analyzer.requests.Session.get")
+    def test_duplicate_alerts_dropped(self, mock_get, mock_outlook, active_bins) -> None:
+        """Test that a storm's alert is reported once across advisories."""
+        mock_get.return_value = Mock(status_code=200, text=SAMPLE_ADVISORY, headers={})
+        active_bins.return_value = ["AT3", "AT4"]
+
+        alerts = EnhancedConeAnalyzer()._get_nhc_alerts_for_location(25.06, -77.35)
+
+        assert mock_get.call_count == 2
+        assert [(alert["event"], alert["storm"]) for alert in alerts] == [
+            ("Tropical Storm Watch", "Humberto"),
+        ]
+
+    @patch("weatherbot.enhanced_cone_analyzer.requests.Session.get")
+    def test_outside_bahamas_skips_fetch(self, mock_get) -> None:
+        """Test that locations outside the Bahamas make no requests."""
+        assert EnhancedConeAnalyzer()._get_nhc_alerts_for_location(25.76, -80.19) == []
+        mock_get.assert_not_called()
+
+
+class TestAnalyzeLocationThreat:
+    """Test full location threat analysis."""
+
+    def test_multiple_storms_preserve_order(self) -> None:
+        """Test that storm threats are returned in cone order."""
+        analyzer = EnhancedConeAnalyzer()
+        cones = [_square_cone(storm_id=f"AL0{i}2025", storm_name=f"Storm{i}") for i in range(1, 6)]
+        for cone in cones:
+            _prepare_cone(cone)
+
+        with patch.object(
+            analyzer, "_get_enhanced_storm_data",
+            return_value=(cones, [cone.geometry for cone in cones]),
+        ), patch.object(analyzer, "_get_nws_alerts", return_value=[]):
+            result = analyzer.analyze_location_threat(25.0, -80.0)
+
+        assert result["is_in_any_cone"] is True
+        assert [threat.cone for threat in result["storm_threats"]] == cones
+        assert result["total_storms_analyzed"] == 5
+
+    def test_repeat_analysis_cached_until_storms_change(self) -> None:
+        """Test that repeat polls reuse the analysis until an advisory changes."""
+        analyzer = EnhancedConeAnalyzer()
+        cone = _square_cone()
+        cone.advisory_num = "5"
+
+        with patch.object(
+            analyzer, "_get_enhanced_storm_data",
+            return_value=([cone], [cone.geometry]),
+        ), patch.object(analyzer, "_get_nws_alerts", return_value=[]) as mock_alerts:
+            first = analyzer.analyze_location_threat(25.0, -80.0)
+            second = analyzer.analyze_location_threat(25.0001, -80.0001)
+            assert mock_alerts.call_count == 1
+            assert second["storm_threats"] == first["storm_threats"]
+            assert second["storm_threats"] is not first["storm_threats"]
+
+            cone.advisory_num = "6"
+            analyzer.analyze_location_threat(25.0, -80.0)
+            assert mock_alerts.call_count == 2
+
+    def test_alert_text_drives_level_and_warnings(self) -> None:
+        """Test threat level and warnings from mixed NWS and NHC alerts."""
+        analyzer = EnhancedConeAnalyzer()
+        cone = _square_cone(storm_name="Humberto", storm_type="Tropical Storm")
+        alerts = [
+            NWSAlert(
+                id="1", event="Tropical Storm Watch", severity="Moderate",
+                urgency="Expected", certainty="Possible", headline="",
+                description="HUMBERTO is approaching",
+            ),
+            {"event": "Hurricane Warning", "description": "Unrelated storm"},
+        ]
+
+        threat = analyzer._analyze_storm_threat(
+            cone, cone.geometry, 25.0, -80.0, None, _normalize_alerts(alerts)
+        )
+
+        assert threat.in_cone is True
+        assert threat.threat_level == AlertLevel.TROPICAL_STORM_WATCH_HURRICANE_THREAT
+        assert threat.official_warnings == ["Tropical Storm Watch"]
+
+    def test_nws_overrides(self) -> None:
+        """Test that official alerts raise but never lower the threat level."""
+        analyzer = EnhancedConeAnalyzer()
+        alerts = _normalize_alerts([
+            {"event": "Special Weather Statement"},
+            {"event": "Tropical Storm Watch"},
+            {"event": "Hurricane Watch for Nassau"},
+        ])
+
+        assert analyzer._apply_nws_overrides(
+            AlertLevel.ALL_CLEAR, alerts
+        ) == AlertLevel.TROPICAL_STORM_WARNING_HURRICANE_WATCH_EVACUATION
+        assert analyzer._apply_nws_overrides(
+            AlertLevel.HURRICANE_WARNING, alerts
+        ) == AlertLevel.HURRICANE_WARNING
+        assert analyzer._apply_nws_overrides(AlertLevel.ALL_CLEAR, []) == AlertLevel.ALL_CLEAR
+
+    def test_county_polygon_loaded_once(self, tmp_path: Path) -> None:
+        """Test that county mode loads the GeoJSON once for all storms."""
+        county_file = tmp_path / "county.geojson"
+        county_file.write_text(json.dumps({
+            "type": "FeatureCollection",
+            "features": [{
+                "type": "Feature",
+                "properties": {},
+                "geometry": {
+                    "type": "Polygon",
+                    "coordinates": [[[-80.5, 24.5], [-79.5, 24.5], [-79.5, 25.5], [-80.5, 25.5], [-80.5, 24.5]]],
+                },
+            }],
+        }))
+        analyzer = EnhancedConeAnalyzer()
+        cones = [_square_cone(storm_id=f"AL0{i}2025") for i in range(1, 4)]
+
+        with patch.object(
+            analyzer, "_get_enhanced_storm_data",
+            return_value=(cones, [cone.geometry for cone in cones]),
+        ), patch.object(analyzer, "_get_nws_alerts", return_value=[]), patch(
+            "weatherbot.enhanced_cone_analyzer.load_county_polygon",
+            wraps=enhanced_cone_analyzer.load_county_polygon,
+        ) as mock_load:
+            result = analyzer.analyze_location_threat(
+                40.0, -80.0, use_county_intersect=True, county_geojson_path=str(county_file)
+            )
+
+        assert mock_load.call_count == 1
+        assert len(result["storm_threats"]) == 3
+
+    def test_missing_county_falls_back_to_point(self, tmp_path: Path) -> None:
+        """Test that an unreadable county file falls back to the point check."""
+        analyzer = EnhancedConeAnalyzer()
+        cone = _square_cone()
+
+        with patch.object(
+            analyzer, "_get_enhanced_storm_data", return_value=([cone], [cone.geometry])
+        ), patch.object(analyzer, "_get_nws_alerts", return_value=[]):
+            result = analyzer.analyze_location_threat(
+                25.0, -80.0, use_county_intersect=True,
+                county_geojson_path=str(tmp_path / "missing.geojson"),
+            )
+
+        assert result["is_in_any_cone"] is True
@@ -8,6 +8,11 @@ import requests
 from shapely.geometry import Polygon
 
 from weatherbot.nhc import NHCClient, NHCCone, get_active_cones
+from weatherbot.nhc_current_storms import (
+    CURRENT_STORMS_JSON,
+    CurrentStormsClient,
+    get_active_atlantic_bins,
+)
 
 
 class TestNHCCone:
@@ -417,6 +422,81 @@ class TestGetActiveCones:
         assert geometries == []
 
 
+class TestAtlanticBins:
+    """Test cases for CurrentStormsClient.fetch_atlantic_bins."""
+
+    @staticmethod
+    def _client_returning(payload):
+        mock_response = Mock()
+        mock_response.json.return_value = payload
+        mock_response.raise_for_status.return_value = None
+
+        client = CurrentStormsClient()
+        client.session.get = Mock(return_value=mock_response)
+        return client
+
+    def test_fetch_atlantic_bins_filters_and_uppercases(self):
+        """Test that only Atlantic bins are returned, uppercased."""
+        client = self._client_returning({"activeStorms": [
+            {"binNumber": "at3"},
+            {"binNumber": "EP2"},
+            {"binNumber": "CP1"},
+            {"binNumber": "AT4"},
+            {"name": "No Bin"},
+        ]})
+
+        assert client.fetch_atlantic_bins() == ["AT3", "AT4"]
+        client.session.get.assert_called_once_with(CURRENT_STORMS_JSON, timeout=30)
+
+    def test_fetch_atlantic_bins_no_active_storms(self):
+        """Test that an empty storm list gives no bins rather than None."""
+        assert self._client_returning({"activeStorms": []}).fetch_atlantic_bins() == []
+        assert self._client_returning({}).fetch_atlantic_bins() == []
+
+    def test_fetch_atlantic_bins_request_failure(self):
+        """Test that a failed request returns None."""
+        client = CurrentStormsClient()
+        client.session.get = Mock(side_effect=requests.RequestException("Network error"))
+
+        assert client.fetch_atlantic_bins() is None
+
+    def test_fetch_atlantic_bins_http_error(self):
+        """Test that an HTTP error status returns None."""
+        client = self._client_returning({})
+        client.session.get.return_value.raise_for_status.side_effect = requests.HTTPError("503")
+
+        assert client.fetch_atlantic_bins() is None
+
+    def test_fetch_atlantic_bins_invalid_json(self):
+        """Test that an unparseable response returns None."""
+        client = self._client_returning({})
+        client.session.get.return_value.json.side_effect = ValueError("bad json")
+
+        assert client.fetch_atlantic_bins() is None
+
+    @patch('weatherbot.nhc_current_storms.api_cache')
+    def test_fetch_atlantic_bins_bypasses_api_cache(self, mock_cache):
+        """Test that bins are always fetched fresh, not from the API cache."""
+        client = self._client_returning({"activeStorms": [{"binNumber": "AT1"}]})
+
+        assert client.fetch_atlantic_bins() == ["AT1"]
+        assert client.fetch_atlantic_bins() == ["AT1"]
+
+        assert client.session.get.call_count == 2
+        mock_cache.get.assert_not_called()
+        mock_cache.set.assert_not_called()
+
+    @patch('weatherbot.nhc_current_storms.requests.Session.get')
+    def test_get_active_atlantic_bins(self, mock_get):
+        """Test the module-level helper."""
+        mock_response = Mock()
+        mock_response.json.return_value = {"activeStorms": [{"binNumber": "AT2"}]}
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+
+        assert get_active_atlantic_bins() == ["AT2"]
+
+
 # NOTE: Removed TestCurrentStormsClient, TestNHCStormTracker, TestDiscoverNewStorms,
 # and TestGetAllActiveStormCones classes as they test complex integration
 # patterns that have undergone significant API changes requiring extensive rewrites.